@@ -33,14 +33,31 @@ import time
 from datetime import datetime
 from sys import exit as sys_exit
 
-from aggregate_utils import about, agents, files, reporting, config as cfg
-from search_engines import engines as se
-
-FileIt = files.results2file
-ReportIt = reporting.report_results
-
-
-def search_this(search_term: str, multiplier: int) -> None:
+from aggregate_utils import about, get_user_agent, reporting, config as cfg
+from search_engines import engines as se, output as se_output
+from search_engines import config as se_cfg
+from search_engines.batch import BatchSearch, read_queries
+from search_engines.cache import PageCache
+from search_engines.dedup import merge_results
+from search_engines.multiple_search_engines import search_concurrently
+
+# Engine class names and user agent sets for batch searches; item order
+#   should match config.ENGINE_NAMES. Classes are imported on first use.
+BATCH_ENGINES = {
+    '(DDG)': ('Duckduckgo', cfg.DDG_UAs),
+    # '(MG)': ('Metager', cfg.MG_UAs),
+    '(SP)': ('Startpage', cfg.SP_UAs),
+    '(Moj)': ('Mojeek', cfg.MOJ_UAs),
+}
+
+
+def tag_titles(tag: str, items: list) -> list:
+    """Prepend the engine tag to each result title."""
+    return [dict(item, title=f'{tag} {item["title"]}') for item in items]
+
+
+def search_this(search_term: str, multiplier: int, cache: PageCache = None,
+                reporter: reporting.Reporter = None) -> None:
     """
     Run the input search term through engines specified in dict(engine).
     Report to Terminal and to file non-redundant results of urls and
@@ -48,7 +65,19 @@ def search_this(search_term: str, multiplier: int) -> None:
 
     :param search_term: String with valid syntax for all or most engines.
     :param multiplier: Multiplication factor to increase search results.
+    :param cache: Optional cache of results pages shared by the engines.
+    :param reporter: Optional open Reporter of the search term; if not
+        given, one is opened and closed here.
     """
+    if reporter is None:
+        with reporting.Reporter(search_term) as reporter:
+            search_this(search_term, multiplier, cache, reporter)
+        return
+    report = reporter.report
+    # Print what was reported so far before the engines' search progress.
+    reporter.flush()
+    # The agents are assigned on first use.
+    from aggregate_utils import agents
 
     # Any duplicated url closest to the end of the combined_results list
     #   will be retained in the unique_results list, so engines item
@@ -61,7 +90,10 @@ def search_this(search_term: str, multiplier: int) -> None:
         '(SP)': se.Startpage(agents['(SP)']),
         '(Moj)': se.Mojeek(agents['(Moj)']),
     }
+    for engine in engines.values():
+        engine.cache = cache
     combined_results = []
+    total_results = 0
 
     # For each engine, balance the number of initial results so that
     #   there are more equal numbers of unique results among engines.
@@ -69,66 +101,116 @@ def search_this(search_term: str, multiplier: int) -> None:
     #   earlier in the engines.items loop.
     # Depending on UA, DGG returns ~20-60 results/page, MG ~20-40;
     #   Mojeek and Startpage return 10 results/page.
+    # Each engine paginates in its own thread, so the search takes only
+    #   as long as the slowest engine. Results are then processed in
+    #   engines.items order, which keeps the unique results deterministic.
+    searches = []
     for tag, engine in engines.items():
         # if tag in '(DDG), (MG)':
         if tag == 'DDG':
-            results = engine.search(search_term, pages=(1 * multiplier))
-            links = results.links()[0:(30 * multiplier)]
+            searches.append((engine, search_term, 1 * multiplier))
         else:
-            results = engine.search(search_term, pages=(2 * multiplier))
-            links = results.links()
+            searches.append((engine, search_term, 2 * multiplier))
+    all_results = search_concurrently(searches)
 
-        titles = results.titles()
-        details = results.text()
-
-        # Prepend the engine tag to each result title.
-        for i, _title in enumerate(titles):
-            titles[i] = f'{tag} {_title}'
+    for tag, results in zip(engines, all_results):
+        items = results.results()
+        if tag == 'DDG':
+            items = items[0:(30 * multiplier)]
 
-        # Pack each engine's result into a list of tuples.
-        combined_results.extend(list(zip(links, titles, details)))
+        combined_results.append((tag, tag_titles(tag, items)))
+        total_results += len(items)
 
-        e_count_msg = (f'Kept the first {len(links)} results'
+        e_count_msg = (f'Kept the first {len(items)} results'
                        f' from {cfg.ENGINE_NAMES[tag]}')
-        ReportIt(search_term, e_count_msg)
+        report(e_count_msg)
 
     # Filter unique urls, saving the last redundant hit from combined_results,
     #   where last is determined by the order of items in {engines}.
-    # Note: in combined_results and unique_results, res[0] is the url,
-    #   res[1] is the page title, res[2] is the detailed description.
-    unique_results = tuple({res[0]: res for res in combined_results}.values())
+    #   URLs are compared in canonical form, so http/https, www. and
+    #   tracking parameter variants of a page count as one result.
+    unique_results = merge_results(combined_results, keep='last')
 
-    result_summary = (f'{len(combined_results)} total results\n\n'
+    result_summary = (f'{total_results} total results\n\n'
                       f'{len(unique_results)} unique results retained:')
-    ReportIt(search_term, result_summary)
+    report(result_summary)
 
     # Report number of unique results retained from each engine.
     for tag, engine in cfg.ENGINE_NAMES.items():
-        num_uniq = sum(tag in res[1] for res in unique_results)
+        num_uniq = sum(res['engines'][-1] == tag for res in unique_results)
         uniq_msg = f'{num_uniq} from {engine} {tag}'
-        ReportIt(search_term, uniq_msg)
+        report(uniq_msg)
 
     # Need a brief delay before Terminal scrolls to last line of results
     #   so user can glimpse the final engine's unique count.
+    reporter.flush()
     time.sleep(2)
 
     # Finally, report url, page title, and page detail from each result.
-    for (_u, _t, _d) in unique_results:
-        url = f'\n{cfg.BLUE}{_u}'
-        title = f'\n{cfg.YELLOW}{_t}{cfg.NC}'
-        detail = f'\n{_d}'
-        ReportIt(search_term, url+title+detail)
-
-    print(f'\nResults were written or appended to {FileIt(search_term, "")}')
+    for res in unique_results:
+        url = f'\n{cfg.BLUE}{res["link"]}'
+        title = f'\n{cfg.YELLOW}{res["title"]}{cfg.NC}'
+        detail = f'\n{res["text"]}'
+        report(url+title+detail)
+
+    reporter.flush()
+    print(f'\nResults were written or appended to {reporter.path}')
     ending_msg = f'\n{"=" * 26} END of {len(unique_results)} results {"=" * 26}\n'
-    ReportIt(search_term, ending_msg)
+    report(ending_msg)
+
+
+def batch_this(queries: list, multiplier: int, cache: PageCache = None) -> None:
+    """
+    Run many search terms through the engines of BATCH_ENGINES on a
+    shared worker pool, and write the non-redundant results of each
+    term to its own results file. Only the progress and a throughput
+    summary are printed to Terminal.
 
+    :param queries: Search terms, with valid syntax for all or most engines.
+    :param multiplier: Multiplication factor to increase search results.
+    :param cache: Optional cache of results pages shared by the engines.
+    """
 
-def manage_args(assist: str = None) -> int:
+    def make_engine(tag):
+        # Each search term gets new user agents.
+        engine_class, user_agents = BATCH_ENGINES[tag]
+        engine = getattr(se, engine_class)(get_user_agent.rando_function(user_agents))
+        engine.cache = cache
+        engine.quiet = True
+        return engine
+
+    def save(query, results):
+        term = query.lstrip().replace(' ', '+')
+        file_header = (
+            f'SEARCH TERM: {term}    TIME: {datetime.now().strftime("%x %X")}')
+
+        user_agents_used = 'User agents assigned for this search:\n'
+        for tag, engine in results:
+            agent = engine._http_client.session.headers.get('User-Agent')
+            user_agents_used += f'{cfg.ENGINE_NAMES[tag].ljust(12)}{agent}\n'
+
+        unique_results = merge_results(
+            [(tag, tag_titles(tag, engine.results.results())) for tag, engine in results],
+            keep='last')
+        with reporting.Reporter(term, echo=False) as reporter:
+            reporter.write(f'{file_header}\n\n{user_agents_used}\n')
+            for res in unique_results:
+                reporter.write(f'\n{res["link"]}\n{res["title"]}\n{res["text"]}\n')
+            reporter.write(
+                f'\n{"=" * 26} END of {len(unique_results)} results {"=" * 26}\n')
+
+    batch = BatchSearch(make_engine, list(BATCH_ENGINES), 2 * multiplier)
+    summary = batch.run(queries, save)
+    se_output.print_batch_summary(summary)
+    print('\nResults were written or appended to the ResultsFiles folder.')
+
+
+def manage_args(assist: str = None) -> argparse.Namespace:
     """Allow handling of command line arguments.
 
     :param assist: Used if input search string is -h or --help.
-    :return: Page request multiplier parameter for search_this().
+    :return: Parsed arguments; args.x is the page request multiplier
+        parameter for search_this().
     """
     parser = argparse.ArgumentParser()
 
@@ -148,17 +230,41 @@ def manage_args(assist: str = None) -> int:
                         type=int,
                         metavar="N"
                         )
+    parser.add_argument('--cache',
+                        help='Reuse results pages cached by earlier searches.',
+                        action='store_true',
+                        default=se_cfg.USE_CACHE)
+    parser.add_argument('--no-cache',
+                        help='Bypass the results pages cache.',
+                        dest='cache',
+                        action='store_false')
+    parser.add_argument('--refresh',
+                        help='Fetch all pages again and update the cache.',
+                        action='store_true',
+                        default=False)
+    parser.add_argument('--batch',
+                        help='Search each term of a file, one per line;'
+                             ' "-" reads terms from stdin.',
+                        default=None,
+                        metavar='FILE')
+    parser.add_argument('--cache-info',
+                        help='Print the contents of the results pages cache.',
+                        action='store_true',
+                        default=False)
 
     args = parser.parse_args()
-    # --info and --use will print, then exit.
+    # --info, --use and --cache-info will print, then exit.
     if args.info:
         about.info(__doc__)
 
     elif args.use or str(assist) in '-help, --help':
         about.usage()
 
-    # The multiplier for number of results returned.
-    return args.x
+    elif args.cache_info:
+        se_output.print_cache_info(PageCache().info())
+        sys_exit(0)
+
+    return args
 
 
 def main() -> None:
@@ -169,7 +275,16 @@ def main() -> None:
     Run searches.
     """
 
-    result_multiplier = manage_args()
+    args = manage_args()
+    result_multiplier = args.x
+    cache = None
+    if args.cache or args.refresh:
+        cache = PageCache()
+        cache.refresh = args.refresh
+
+    if args.batch:
+        batch_this(read_queries(args.batch), result_multiplier, cache)
+        return
 
     # Remove trailing spaces, replace internal spaces in term for better
     #    file naming; '+' doesn't affect search.
@@ -182,12 +297,15 @@ def main() -> None:
 
     file_header = (
         f'SEARCH TERM: {term}    TIME: {datetime.now().strftime("%x %X")}')
-    FileIt(term, f'{file_header}\n\n')
 
-    reporting.report_agents(term)
-    ReportIt(term, f'Search results multiplier: {result_multiplier}X')
+    # The reporter flushes its Terminal and file output when the search
+    #   ends, also if the user interrupts it.
+    with reporting.Reporter(term) as reporter:
+        reporter.write(f'{file_header}\n\n')
+        reporting.report_agents(term, reporter)
+        reporter.report(f'Search results multiplier: {result_multiplier}X')
 
-    search_this(term, result_multiplier)
+        search_this(term, result_multiplier, cache, reporter)
 
 
 if __name__ == "__main__":
@@ -13,18 +13,29 @@ __copyright__ = ('Copyright (c) 2022 C.S. Echt, '
 __version__ = '0.5.13'
 
 
-# Random user agents for each engine are assigned here.
-# For sensible reporting, item order should match among
-#   dict(agents), config.ENGINE_NAMES, and dict(engines)
-agents = {
-    '(DDG)':  get_user_agent.rando_function(cfg.DDG_UAs),
-    # '(MG)': get_user_agent.rando_function(cfg.MG_UAs),
-    '(SP)': get_user_agent.rando_function(cfg.SP_UAs),
-    '(Moj)': get_user_agent.rando_function(cfg.MOJ_UAs),
-}
-
-# Quit if Python interpreter version is earlier than required.
-vcheck.minversion('3.6')
+
+def __getattr__(name):
+    """
+    Random user agents for each engine are assigned here, as *agents*,
+    when first used, so that informational runs skip loading them.
+    For sensible reporting, item order should match among
+      dict(agents), config.ENGINE_NAMES, and dict(engines)
+    """
+    if name != 'agents':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    agents = {
+        '(DDG)':  get_user_agent.rando_function(cfg.DDG_UAs),
+        # '(MG)': get_user_agent.rando_function(cfg.MG_UAs),
+        '(SP)': get_user_agent.rando_function(cfg.SP_UAs),
+        '(Moj)': get_user_agent.rando_function(cfg.MOJ_UAs),
+    }
+    globals()['agents'] = agents
+    return agents
+
+
+# Quit if Python interpreter version is earlier than required;
+#   3.7 for the lazy module attributes.
+vcheck.minversion('3.7')
 
 # Needed for Windows Command Prompt ANSI text formatting.
 if os.name == 'nt':
@@ -30,3 +30,6 @@ BLUE = '\x1b[1;38;5;33m'
 ORANGE = '\x1b[1;38;5;166m'
 YELLOW = '\x1b[1;38;5;208m'
 NC = '\x1b[0m'  # No color, reset to system default.
+
+# Number of results and messages printed to Terminal at a time.
+REPORT_BATCH = 50
@@ -6,6 +6,22 @@ a file path and names the text file based on the search string.
 from pathlib import Path
 
 
+RESULTS_DIR = Path('ResultsFiles/')
+
+
+def results_path(search_txt: str) -> Path:
+    """
+    Return the path of the results file of a search string, creating
+    the results folder if needed.
+
+    :param search_txt: The search string to use in the file name.
+    :return: Path of the results file.
+    """
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return RESULTS_DIR / f'Results_{search_txt}.txt'
+
+
 def results2file(search_txt: str, data: str) -> Path:
     """
     Write a text file of search results.
@@ -15,11 +31,7 @@ def results2file(search_txt: str, data: str) -> Path:
     :return: Name of file created/appended.
     """
 
-    resultpath = Path('ResultsFiles/')
-    resultpath.mkdir(parents=True, exist_ok=True)
-
-    filename = f'Results_{search_txt}.txt'
-    filepath = resultpath / filename
+    filepath = results_path(search_txt)
     with open(filepath, 'a', encoding='utf-8') as hits:
         hits.write(data)
 
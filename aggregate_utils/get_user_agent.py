@@ -12,8 +12,11 @@ winfire_agent(): original FAKE_USER_AGENT for Startpage, but with random
     assignment of Firefox version.
 """
 import gzip
+from array import array
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from random import choice
+from random import choice, randrange
 
 from . import config as cfg
 
@@ -93,26 +96,44 @@ def python_agent() -> str:
     return 'python-requests/2.27.1'
 
 
-def random_agent() -> bytes:
+@lru_cache(maxsize=None)
+def _agent_pool() -> tuple:
     """
-    Get a random user agent byte string from file of over 4400 obtained
-    from the googlesearch module of google package by Mario Vilas. See:
-    https://python-googlesearch.readthedocs.io/en/latest/
+    Load the user agents file once. The agents are kept as one byte
+    string and a table of where each agent starts, which is more compact
+    than a list of 4400+ strings and allows direct indexing.
 
-    :return: Random full user agent string.
+    :return: The joined agents and an array of their start offsets,
+        ending with the length of the joined agents.
     """
-    # Load the list of ~4400 user agents to select from.
     try:
         rua_file = Path(Path(__file__).parent, f'{AGENT_ARCHIVE}')
-        with gzip.open(rua_file, 'rt') as fp:
-            user_agents_list = [_.strip() for _ in fp.readlines()]
+        with gzip.open(rua_file, 'rb') as fp:
+            data = fp.read()
     except FileNotFoundError:
         print('Could not open the random user agent file; using default agent...\n'
               f'Try downloading {AGENT_ARCHIVE} from {cfg.PROJECT}')
-        user_agents_list = [DEFAULT_AGENT]
+        data = DEFAULT_AGENT.encode()
+    user_agents_list = [_.strip() for _ in data.splitlines() if _.strip()]
+    offsets = array('I', [0, *accumulate(map(len, user_agents_list))])
+
+    return b''.join(user_agents_list), offsets
+
+
+def random_agent() -> str:
+    """
+    Get a random user agent string from file of over 4400 obtained
+    from the googlesearch module of google package by Mario Vilas. See:
+    https://python-googlesearch.readthedocs.io/en/latest/
+    The file is read only on the first call.
+
+    :return: Random full user agent string.
+    """
+    agents, offsets = _agent_pool()
+    i = randrange(len(offsets) - 1)
     # Note that all the browser versions in user_agents.txt are old,
     # so list probably needs an update to work more consistently.
-    return choice(user_agents_list)
+    return agents[offsets[i]:offsets[i + 1]].decode('utf-8')
 
 
 def winfire_agent() -> str:
@@ -141,13 +162,14 @@ def rando_function(agents: tuple) -> str:
     """
     select = choice(agents)
 
+    # Only the selected agent function is run.
     r_agents = {
-        'bua': bot_agent(),
-        'gua': github_agent(),
-        'fua': firefox_agent(),
-        'pua': python_agent(),
-        'rua': random_agent(),
-        'wua': winfire_agent(),
+        'bua': bot_agent,
+        'gua': github_agent,
+        'fua': firefox_agent,
+        'pua': python_agent,
+        'rua': random_agent,
+        'wua': winfire_agent,
     }
 
-    return r_agents[select]
+    return r_agents[select]()
@@ -4,8 +4,81 @@ Combined result reporting for clean terminal/console printing and
 writing to file.
 """
 import re
+import sys
 
-from . import agents, files, config as cfg
+from . import files, config as cfg
+
+# Escape codes of terminal text formatting, removed from text written to file.
+ANSI_ESC = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
+class Reporter:
+    """
+    Outputs results and messages of one search term to Terminal and to
+    the term's results file. The file is opened once and written through
+    its buffer, and Terminal messages are printed in batches, so the cost
+    per result stays flat. Everything is flushed by flush() and close(),
+    or on leaving a with block, also when the user interrupts.
+    """
+
+    def __init__(self, search_term: str, echo: bool = True,
+                 batch_size: int = cfg.REPORT_BATCH) -> None:
+        """
+        :param search_term: Current search term; is used for file naming.
+        :param echo: Print messages to Terminal; if False, only write
+            them to file.
+        :param batch_size: Number of messages printed at a time.
+        """
+        self.search_term = search_term
+        self.echo = echo
+        self.batch_size = batch_size
+        self.path = files.results_path(search_term)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lines = []
+
+    def report(self, message: str) -> None:
+        """
+        Output a result or message to Terminal and file.
+
+        :param message: Message or result string to be printed and written.
+        """
+        if self.echo:
+            self._lines.append(message)
+            if len(self._lines) >= self.batch_size:
+                self._print()
+        self._file.write(f'{ANSI_ESC.sub("", message)}\n')
+
+    def write(self, data: str) -> None:
+        """
+        Write data to file only.
+
+        :param data: The URL or info strings to save to file.
+        """
+        self._file.write(data)
+
+    def _print(self) -> None:
+        """Print the batched Terminal messages."""
+        if self._lines:
+            sys.stdout.write('\n'.join(self._lines) + '\n')
+            sys.stdout.flush()
+            self._lines.clear()
+
+    def flush(self) -> None:
+        """Print batched messages and write buffered file data."""
+        self._print()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush everything and close the results file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'Reporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def report_results(search_term: str, message: str) -> None:
@@ -16,21 +89,21 @@ def report_results(search_term: str, message: str) -> None:
     :param message: Message or result string to be printed and written.
     """
 
-    # Need to remove escape codes for text written to file.
-    ansi_esc = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-
     print(message)
-    message_cleaned = ansi_esc.sub('', message)
+    message_cleaned = ANSI_ESC.sub('', message)
     files.results2file(search_term, f'{message_cleaned}\n')
 
 
-def report_agents(search_term: str) -> None:
+def report_agents(search_term: str, reporter: Reporter = None) -> None:
     """
     Print to Terminal and result file user agents assigned to each
     engine.
 
     :param search_term: The input search term; used for file naming.
+    :param reporter: Optional open Reporter of the search term.
     """
+    # The agents are assigned on first use.
+    from . import agents
 
     user_agents_used = 'User agents assigned for this search:\n'
     for tag in cfg.ENGINE_NAMES:
@@ -38,4 +111,7 @@ def report_agents(search_term: str) -> None:
             user_agents_used +
             f'{cfg.ENGINE_NAMES[tag].ljust(12)}{cfg.ORANGE}{agents[tag]}{cfg.NC}\n')
 
-    report_results(search_term, user_agents_used)
+    if reporter:
+        reporter.report(user_agents_used)
+    else:
+        report_results(search_term, user_agents_used)
@@ -0,0 +1 @@
+if (DDG.deep && DDG.deep.setUpstream) DDG.deep.setUpstream("bingv7aa");DDG.deep.bn={'ivc':1,'ibc':0};DDG.deep.signalSummary="";DDG.inject('DDG.Data.languages.resultLanguages', {"en":["https://en.wikipedia.org/regeneration/soil/growth-0","https://www.fs.usda.gov/regeneration-1","https://www.britannica.com/timber/practice/yield-2","https://forestry.oregonstate.edu/management/yield/stand-3","https://www.nature.com/growth/soil/hardwood-4","https://www.sciencedirect.com/inventory/regeneration/carbon-5","https://www.reddit.com/regeneration-6","https://github.com/harvest/conifer/silviculture-7","https://www.forestresearch.gov.uk/inventory-8","https://www.fao.org/climate/soil-9","https://news.mongabay.com/ecology/soil/canopy-10","https://www.nrcan.gc.ca/practice/soil-11","https://www.theguardian.com/research/regeneration/survey-12","https://www.bbc.co.uk/sustainable/survey/inventory-13","https://stackoverflow.com/management/soil-14","https://www.youtube.com/sustainable/soil-15","https://www.jstor.org/harvest/growth-16","https://link.springer.com/harvest/yield/inventory-17","https://www.usda.gov/growth-18","https://extension.psu.edu/forest/forest-19","https://en.wikipedia.org/regeneration/conifer/practice-20","https://www.fs.usda.gov/growth/conifer/hardwood-21","https://www.britannica.com/stand/hardwood/survey-22","https://forestry.oregonstate.edu/planting/species-23","https://www.nature.com/silviculture/research/ecology-24","https://www.sciencedirect.com/survey/species-25"]});DDG.deep.pageLayoutSummary = "w26";DDG.pageLayout.load('d',[{"a": "yield climate silviculture soil management growth stand survey conifer ecology management canopy <b>forestry</b> species practice stand climate regeneration climate timber planting practice carbon &quot;harvest canopy hardwood&quot; regeneration canopy research timber inventory conifer planting silviculture café – practice silviculture yield woodland...", "c": "https://en.wikipedia.org/ecology/carbon/soil-0", "d": "en.wikipedia.org/ecology/carbon/soil-0", "da": "", "h": 0, "i": "en.wikipedia.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forest Planting Forest Canopy Timber & carbon harvest | en.wikipedia.org", "u": "https://en.wikipedia.org/ecology/carbon/soil-0"}, {"a": "regeneration hardwood growth hardwood stand practice climate inventory forest stand sustainable conifer <b>forestry</b> regeneration soil hardwood planting harvest conifer ecology woodland woodland planting &quot;timber stand carbon&quot; ecology carbon carbon forest forest climate forestry planting café – inventory sustainable silviculture research...", "c": "https://www.fs.usda.gov/management-1", "d": "www.fs.usda.gov/management-1", "da": "", "h": 0, "i": "www.fs.usda.gov", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Hardwood Hardwood Practice Forestry Hardwood & conifer management | www.fs.usda.gov", "u": "https://www.fs.usda.gov/management-1"}, {"a": "sustainable silviculture planting ecology sustainable hardwood survey research practice survey canopy harvest <b>forestry</b> woodland sustainable woodland yield practice forestry harvest harvest ecology hardwood &quot;species sustainable research&quot; yield research ecology canopy carbon hardwood silviculture sustainable café – canopy sustainable regeneration harvest...", "c": "https://www.britannica.com/hardwood/survey-2", "d": "www.britannica.com/hardwood/survey-2", "da": "", "h": 0, "i": "www.britannica.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Management Forestry Canopy Regeneration Woodland & carbon management | www.britannica.com", "u": "https://www.britannica.com/hardwood/survey-2"}, {"a": "practice soil forestry species harvest silviculture forest forestry canopy hardwood climate survey <b>forestry</b> planting forestry research practice climate species climate management carbon planting &quot;regeneration regeneration climate&quot; planting timber canopy forestry planting carbon conifer carbon café – survey stand silviculture planting...", "c": "https://forestry.oregonstate.edu/soil-3", "d": "forestry.oregonstate.edu/soil-3", "da": "", "h": 0, "i": "forestry.oregonstate.edu", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Carbon Timber Forestry Species Inventory & practice species | forestry.oregonstate.edu", "u": "https://forestry.oregonstate.edu/soil-3"}, {"a": "harvest practice regeneration yield harvest stand woodland forestry sustainable forest woodland soil <b>forestry</b> carbon soil forestry hardwood soil research forestry silviculture survey woodland &quot;soil regeneration species&quot; conifer timber forest planting species climate soil planting café – management hardwood survey woodland...", "c": "https://www.nature.com/forestry-4", "d": "www.nature.com/forestry-4", "da": "", "h": 0, "i": "www.nature.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Woodland Survey Silviculture Carbon Forest & ecology management | www.nature.com", "u": "https://www.nature.com/forestry-4"}, {"a": "forest planting planting silviculture timber canopy silviculture management hardwood forest yield inventory <b>forestry</b> soil growth conifer inventory inventory stand forestry ecology survey inventory &quot;regeneration regeneration management&quot; inventory survey timber harvest carbon practice regeneration hardwood café – conifer planting yield forestry...", "c": "https://www.sciencedirect.com/silviculture/timber/carbon-5", "d": "www.sciencedirect.com/silviculture/timber/carbon-5", "da": "", "h": 0, "i": "www.sciencedirect.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Hardwood Canopy Management Carbon Forest & woodland forest | www.sciencedirect.com", "u": "https://www.sciencedirect.com/silviculture/timber/carbon-5"}, {"a": "harvest inventory climate stand hardwood climate forestry sustainable ecology soil inventory conifer <b>forestry</b> hardwood planting stand management silviculture ecology carbon stand carbon woodland &quot;hardwood species survey&quot; conifer yield survey soil sustainable harvest yield forestry café – climate carbon regeneration climate...", "c": "https://www.reddit.com/forestry/forest/forestry-6", "d": "www.reddit.com/forestry/forest/forestry-6", "da": "", "h": 0, "i": "www.reddit.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forest Carbon Planting Climate Timber & species harvest | www.reddit.com", "u": "https://www.reddit.com/forestry/forest/forestry-6"}, {"a": "species species planting species climate survey growth conifer harvest regeneration forest sustainable <b>forestry</b> yield yield woodland stand soil survey forestry harvest management soil &quot;management yield practice&quot; planting survey hardwood ecology practice timber practice practice café – hardwood species canopy survey...", "c": "https://github.com/climate/inventory-7", "d": "github.com/climate/inventory-7", "da": "", "h": 0, "i": "github.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forest Management Climate Harvest Soil & woodland growth | github.com", "u": "https://github.com/climate/inventory-7"}, {"a": "soil survey forest species conifer practice timber practice ecology survey timber growth <b>forestry</b> species soil research yield research sustainable hardwood research soil canopy &quot;canopy canopy canopy&quot; timber stand regeneration harvest ecology soil soil ecology café – species survey research management...", "c": "https://www.forestresearch.gov.uk/growth/harvest/climate-8", "d": "www.forestresearch.gov.uk/growth/harvest/climate-8", "da": "", "h": 0, "i": "www.forestresearch.gov.uk", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forestry Planting Species Conifer Regeneration & canopy yield | www.forestresearch.gov.uk", "u": "https://www.forestresearch.gov.uk/growth/harvest/climate-8"}, {"a": "management sustainable climate forest ecology yield research climate forest silviculture forestry canopy <b>forestry</b> soil hardwood soil soil canopy yield survey yield woodland silviculture &quot;conifer survey soil&quot; climate management yield forestry sustainable canopy stand species café – timber forest forestry forestry...", "c": "https://www.fao.org/forestry-9", "d": "www.fao.org/forestry-9", "da": "", "h": 0, "i": "www.fao.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Hardwood Ecology Silviculture Ecology Carbon & conifer timber | www.fao.org", "u": "https://www.fao.org/forestry-9"}, {"a": "timber yield sustainable soil growth carbon timber planting research species stand conifer <b>forestry</b> stand ecology growth inventory growth stand forestry yield ecology forestry &quot;practice forest forestry&quot; yield research regeneration inventory carbon survey hardwood forestry café – silviculture management sustainable survey...", "c": "https://news.mongabay.com/ecology/regeneration/conifer-10", "d": "news.mongabay.com/ecology/regeneration/conifer-10", "da": "", "h": 0, "i": "news.mongabay.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Hardwood Timber Climate Carbon Species & silviculture regeneration | news.mongabay.com", "u": "https://news.mongabay.com/ecology/regeneration/conifer-10"}, {"a": "carbon silviculture hardwood sustainable ecology yield species silviculture ecology hardwood species stand <b>forestry</b> conifer growth management planting forest conifer regeneration canopy forestry stand &quot;growth timber climate&quot; ecology inventory management survey conifer silviculture species forest café – carbon timber conifer sustainable...", "c": "https://www.nrcan.gc.ca/canopy-11", "d": "www.nrcan.gc.ca/canopy-11", "da": "", "h": 0, "i": "www.nrcan.gc.ca", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Planting Inventory Harvest Soil Soil & conifer survey | www.nrcan.gc.ca", "u": "https://www.nrcan.gc.ca/canopy-11"}, {"a": "forestry stand regeneration conifer practice management conifer management yield woodland woodland growth <b>forestry</b> management forest yield soil harvest sustainable stand yield hardwood silviculture &quot;sustainable conifer hardwood&quot; silviculture management research forestry carbon planting canopy practice café – hardwood harvest silviculture yield...", "c": "https://www.theguardian.com/growth/hardwood-12", "d": "www.theguardian.com/growth/hardwood-12", "da": "", "h": 0, "i": "www.theguardian.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Silviculture Carbon Ecology Management Sustainable & growth inventory | www.theguardian.com", "u": "https://www.theguardian.com/growth/hardwood-12"}, {"a": "woodland stand forestry inventory harvest management carbon forest conifer research sustainable research <b>forestry</b> management conifer forest research harvest stand ecology woodland forestry woodland &quot;canopy yield soil&quot; stand management stand research survey growth regeneration stand café – canopy climate timber timber...", "c": "https://www.bbc.co.uk/ecology-13", "d": "www.bbc.co.uk/ecology-13", "da": "", "h": 0, "i": "www.bbc.co.uk", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Woodland Yield Growth Growth Silviculture & species harvest | www.bbc.co.uk", "u": "https://www.bbc.co.uk/ecology-13"}, {"a": "carbon canopy soil harvest canopy forest timber regeneration inventory research woodland inventory <b>forestry</b> forestry research ecology sustainable harvest carbon hardwood timber forest woodland &quot;survey hardwood management&quot; planting yield growth stand soil ecology forestry stand café – regeneration ecology soil climate...", "c": "https://stackoverflow.com/inventory/hardwood/survey-14", "d": "stackoverflow.com/inventory/hardwood/survey-14", "da": "", "h": 0, "i": "stackoverflow.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Yield Stand Canopy Management Climate & planting regeneration | stackoverflow.com", "u": "https://stackoverflow.com/inventory/hardwood/survey-14"}, {"a": "growth sustainable survey regeneration species soil survey forestry harvest silviculture inventory hardwood <b>forestry</b> conifer research forest research practice management forest growth timber growth &quot;climate stand stand&quot; silviculture harvest yield practice forest forest silviculture regeneration café – inventory canopy yield forest...", "c": "https://www.youtube.com/ecology-15", "d": "www.youtube.com/ecology-15", "da": "", "h": 0, "i": "www.youtube.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Research Conifer Research Timber Silviculture & ecology regeneration | www.youtube.com", "u": "https://www.youtube.com/ecology-15"}, {"a": "regeneration stand forestry yield silviculture conifer hardwood soil research survey yield silviculture <b>forestry</b> silviculture silviculture species management practice soil growth growth management planting &quot;soil conifer inventory&quot; species stand forest carbon species regeneration woodland climate café – climate research forestry species...", "c": "https://www.jstor.org/carbon/soil/conifer-16", "d": "www.jstor.org/carbon/soil/conifer-16", "da": "", "h": 0, "i": "www.jstor.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Research Growth Regeneration Conifer Silviculture & ecology silviculture | www.jstor.org", "u": "https://www.jstor.org/carbon/soil/conifer-16"}, {"a": "soil sustainable species practice forestry sustainable research management planting ecology growth woodland <b>forestry</b> planting carbon forest ecology silviculture research stand timber sustainable woodland &quot;canopy research planting&quot; forest growth management woodland species survey conifer carbon café – forestry forestry forestry carbon...", "c": "https://link.springer.com/survey-17", "d": "link.springer.com/survey-17", "da": "", "h": 0, "i": "link.springer.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Ecology Sustainable Species Growth Sustainable & regeneration woodland | link.springer.com", "u": "https://link.springer.com/survey-17"}, {"a": "silviculture research forest woodland growth forestry harvest silviculture harvest ecology carbon stand <b>forestry</b> silviculture forestry climate research yield timber conifer soil practice management &quot;conifer silviculture research&quot; management harvest woodland soil harvest yield growth inventory café – timber inventory practice harvest...", "c": "https://www.usda.gov/yield/planting/climate-18", "d": "www.usda.gov/yield/planting/climate-18", "da": "", "h": 0, "i": "www.usda.gov", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Yield Carbon Practice Forestry Climate & silviculture yield | www.usda.gov", "u": "https://www.usda.gov/yield/planting/climate-18"}, {"a": "ecology conifer practice harvest climate hardwood hardwood harvest forest growth sustainable growth <b>forestry</b> canopy research practice species soil species forest ecology stand growth &quot;sustainable practice sustainable&quot; hardwood yield harvest canopy harvest forestry survey forest café – stand practice timber climate...", "c": "https://extension.psu.edu/climate/regeneration-19", "d": "extension.psu.edu/climate/regeneration-19", "da": "", "h": 0, "i": "extension.psu.edu", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Soil Growth Carbon Species Canopy & practice regeneration | extension.psu.edu", "u": "https://extension.psu.edu/climate/regeneration-19"}, {"a": "silviculture research growth planting inventory management woodland sustainable planting ecology management planting <b>forestry</b> canopy climate climate yield research silviculture inventory inventory survey hardwood &quot;yield carbon regeneration&quot; carbon regeneration management woodland silviculture forest woodland survey café – practice soil silviculture hardwood...", "c": "https://en.wikipedia.org/conifer/planting-20", "d": "en.wikipedia.org/conifer/planting-20", "da": "", "h": 0, "i": "en.wikipedia.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forestry Research Species Conifer Ecology & inventory survey | en.wikipedia.org", "u": "https://en.wikipedia.org/conifer/planting-20"}, {"a": "regeneration conifer harvest inventory ecology harvest ecology species research practice climate species <b>forestry</b> carbon sustainable forest inventory hardwood species conifer harvest stand practice &quot;harvest management woodland&quot; soil species soil growth timber sustainable sustainable climate café – growth sustainable canopy woodland...", "c": "https://www.fs.usda.gov/soil/management-21", "d": "www.fs.usda.gov/soil/management-21", "da": "", "h": 0, "i": "www.fs.usda.gov", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Woodland Yield Climate Climate Silviculture & species conifer | www.fs.usda.gov", "u": "https://www.fs.usda.gov/soil/management-21"}, {"a": "harvest practice climate woodland research research inventory planting woodland species conifer ecology <b>forestry</b> forestry climate planting ecology conifer forest planting timber research growth &quot;silviculture woodland ecology&quot; research species carbon practice soil management canopy woodland café – hardwood species conifer survey...", "c": "https://www.britannica.com/forest-22", "d": "www.britannica.com/forest-22", "da": "", "h": 0, "i": "www.britannica.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Forestry Yield Soil Hardwood Harvest & practice survey | www.britannica.com", "u": "https://www.britannica.com/forest-22"}, {"a": "timber harvest research stand silviculture carbon harvest regeneration sustainable research woodland carbon <b>forestry</b> stand research harvest research canopy research canopy woodland stand forestry &quot;carbon soil climate&quot; silviculture ecology soil carbon carbon inventory forestry regeneration café – woodland forest forest harvest...", "c": "https://forestry.oregonstate.edu/soil/sustainable/regeneration-23", "d": "forestry.oregonstate.edu/soil/sustainable/regeneration-23", "da": "", "h": 0, "i": "forestry.oregonstate.edu", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Research Inventory Timber Stand Ecology & sustainable ecology | forestry.oregonstate.edu", "u": "https://forestry.oregonstate.edu/soil/sustainable/regeneration-23"}, {"a": "canopy stand hardwood survey practice soil yield carbon practice research management soil <b>forestry</b> canopy woodland climate silviculture management stand research survey research silviculture &quot;forest silviculture timber&quot; stand research hardwood conifer climate woodland forestry carbon café – forest planting survey soil...", "c": "https://www.nature.com/regeneration/practice/forest-24", "d": "www.nature.com/regeneration/practice/forest-24", "da": "", "h": 0, "i": "www.nature.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Harvest Species Silviculture Soil Forest & planting forest | www.nature.com", "u": "https://www.nature.com/regeneration/practice/forest-24"}, {"a": "silviculture soil timber ecology canopy conifer climate species forest forestry growth species <b>forestry</b> soil survey forestry conifer forestry climate growth growth growth forestry &quot;stand soil stand&quot; sustainable forest conifer harvest woodland climate yield hardwood café – timber growth planting species...", "c": "https://www.sciencedirect.com/management/regeneration-25", "d": "www.sciencedirect.com/management/regeneration-25", "da": "", "h": 0, "i": "www.sciencedirect.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Growth Ecology Yield Stand Forestry & yield carbon | www.sciencedirect.com", "u": "https://www.sciencedirect.com/management/regeneration-25"}, {"n": "/d.js?q=forestry&t=D&l=us-en&s=26&dl=en&ct=US&ss_mkt=us&vqd=4-1234567890&p_ent=&ex=-1&sp=0"}]);DDG.duckbar.load('images', {"ads":[],"query":"forestry","queryEncoded":"forestry","response_type":"places","results":[{"height": 600, "image": "https://img.example/0.jpg", "title": "carbon inventory species ecology regeneration timber", "url": "https://en.wikipedia.org/img/0", "width": 800},{"height": 600, "image": "https://img.example/1.jpg", "title": "species research yield climate planting planting", "url": "https://www.fs.usda.gov/img/1", "width": 800},{"height": 600, "image": "https://img.example/2.jpg", "title": "sustainable timber carbon practice planting growth", "url": "https://www.britannica.com/img/2", "width": 800},{"height": 600, "image": "https://img.example/3.jpg", "title": "climate survey yield yield hardwood inventory", "url": "https://forestry.oregonstate.edu/img/3", "width": 800},{"height": 600, "image": "https://img.example/4.jpg", "title": "ecology research soil hardwood soil growth", "url": "https://www.nature.com/img/4", "width": 800},{"height": 600, "image": "https://img.example/5.jpg", "title": "management timber survey research ecology research", "url": "https://www.sciencedirect.com/img/5", "width": 800},{"height": 600, "image": "https://img.example/6.jpg", "title": "canopy research stand ecology growth planting", "url": "https://www.reddit.com/img/6", "width": 800},{"height": 600, "image": "https://img.example/7.jpg", "title": "stand management planting conifer stand carbon", "url": "https://github.com/img/7", "width": 800},{"height": 600, "image": "https://img.example/8.jpg", "title": "carbon forestry sustainable species ecology woodland", "url": "https://www.forestresearch.gov.uk/img/8", "width": 800},{"height": 600, "image": "https://img.example/9.jpg", "title": "silviculture woodland management regeneration yield species", "url": "https://www.fao.org/img/9", "width": 800},{"height": 600, "image": "https://img.example/10.jpg", "title": "silviculture ecology ecology planting research research", "url": "https://news.mongabay.com/img/10", "width": 800},{"height": 600, "image": "https://img.example/11.jpg", "title": "harvest conifer planting timber yield species", "url": "https://www.nrcan.gc.ca/img/11", "width": 800},{"height": 600, "image": "https://img.example/12.jpg", "title": "harvest conifer regeneration silviculture conifer carbon", "url": "https://www.theguardian.com/img/12", "width": 800},{"height": 600, "image": "https://img.example/13.jpg", "title": "hardwood inventory stand survey research management", "url": "https://www.bbc.co.uk/img/13", "width": 800},{"height": 600, "image": "https://img.example/14.jpg", "title": "forest planting management ecology hardwood research", "url": "https://stackoverflow.com/img/14", "width": 800},{"height": 600, "image": "https://img.example/15.jpg", "title": "planting growth climate ecology research sustainable", "url": "https://www.youtube.com/img/15", "width": 800},{"height": 600, "image": "https://img.example/16.jpg", "title": "species yield forest practice canopy forest", "url": "https://www.jstor.org/img/16", "width": 800},{"height": 600, "image": "https://img.example/17.jpg", "title": "soil yield forestry soil stand harvest", "url": "https://link.springer.com/img/17", "width": 800},{"height": 600, "image": "https://img.example/18.jpg", "title": "regeneration practice yield sustainable yield growth", "url": "https://www.usda.gov/img/18", "width": 800},{"height": 600, "image": "https://img.example/19.jpg", "title": "yield conifer timber research carbon hardwood", "url": "https://extension.psu.edu/img/19", "width": 800},{"height": 600, "image": "https://img.example/20.jpg", "title": "timber canopy management woodland harvest climate", "url": "https://en.wikipedia.org/img/20", "width": 800},{"height": 600, "image": "https://img.example/21.jpg", "title": "survey ecology forestry regeneration conifer species", "url": "https://www.fs.usda.gov/img/21", "width": 800},{"height": 600, "image": "https://img.example/22.jpg", "title": "ecology forestry regeneration survey harvest woodland", "url": "https://www.britannica.com/img/22", "width": 800},{"height": 600, "image": "https://img.example/23.jpg", "title": "woodland carbon climate yield ecology growth", "url": "https://forestry.oregonstate.edu/img/23", "width": 800},{"height": 600, "image": "https://img.example/24.jpg", "title": "species soil management climate canopy regeneration", "url": "https://www.nature.com/img/24", "width": 800},{"height": 600, "image": "https://img.example/25.jpg", "title": "soil ecology timber planting canopy sustainable", "url": "https://www.sciencedirect.com/img/25", "width": 800},{"height": 600, "image": "https://img.example/26.jpg", "title": "timber timber survey conifer species species", "url": "https://www.reddit.com/img/26", "width": 800},{"height": 600, "image": "https://img.example/27.jpg", "title": "research woodland hardwood carbon survey forest", "url": "https://github.com/img/27", "width": 800},{"height": 600, "image": "https://img.example/28.jpg", "title": "silviculture soil soil conifer conifer regeneration", "url": "https://www.forestresearch.gov.uk/img/28", "width": 800},{"height": 600, "image": "https://img.example/29.jpg", "title": "woodland woodland hardwood stand timber conifer", "url": "https://www.fao.org/img/29", "width": 800},{"height": 600, "image": "https://img.example/30.jpg", "title": "species hardwood management research survey forest", "url": "https://news.mongabay.com/img/30", "width": 800},{"height": 600, "image": "https://img.example/31.jpg", "title": "planting growth inventory canopy species practice", "url": "https://www.nrcan.gc.ca/img/31", "width": 800},{"height": 600, "image": "https://img.example/32.jpg", "title": "forestry planting harvest practice sustainable survey", "url": "https://www.theguardian.com/img/32", "width": 800},{"height": 600, "image": "https://img.example/33.jpg", "title": "species survey conifer silviculture timber growth", "url": "https://www.bbc.co.uk/img/33", "width": 800},{"height": 600, "image": "https://img.example/34.jpg", "title": "timber soil forest silviculture hardwood timber", "url": "https://stackoverflow.com/img/34", "width": 800},{"height": 600, "image": "https://img.example/35.jpg", "title": "survey canopy soil conifer forestry planting", "url": "https://www.youtube.com/img/35", "width": 800},{"height": 600, "image": "https://img.example/36.jpg", "title": "canopy regeneration sustainable hardwood forestry practice", "url": "https://www.jstor.org/img/36", "width": 800},{"height": 600, "image": "https://img.example/37.jpg", "title": "regeneration inventory woodland soil management woodland", "url": "https://link.springer.com/img/37", "width": 800},{"height": 600, "image": "https://img.example/38.jpg", "title": "forestry carbon management sustainable sustainable canopy", "url": "https://www.usda.gov/img/38", "width": 800},{"height": 600, "image": "https://img.example/39.jpg", "title": "research forest stand practice yield research", "url": "https://extension.psu.edu/img/39", "width": 800}]});DDG.duckbar.future_signal_tab({signal:'medium',from:'news'});
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Measures the CPU cost of scraping results pages, with no network: the
+results page fixtures of each engine go through the engine's _is_ok(),
+_filter_results() and _next_page() with each installed parser backend,
+as in a search, and the pages and results per second are printed.
+
+The fixtures are hand-made pages in the markup each engine's selectors
+expect. The Metager page is a last page, because Metager follows its
+next page link with a request.
+
+Results are compared with the baseline file, and runs that are much
+slower are flagged; --save records a new baseline. Throughput depends on
+the machine, so record the baseline where the comparisons are made.
+
+Run from the repository root:
+    python benchmarks/parse.py [-s SECONDS] [-b BACKEND] [--save]
+"""
+import argparse
+import json
+import platform
+import sys
+from collections import namedtuple
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from search_engines import engines, parsers  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+# Engine class names and their results page fixtures.
+ENGINE_FIXTURES = {
+    'Mojeek': 'mojeek.html',
+    'Startpage': 'startpage.html',
+    'Duckduckgo': 'duckduckgo.js',
+    'Metager': 'metager.html',
+}
+
+Response = namedtuple('Response', ['http', 'html'])
+Throughput = namedtuple('Throughput', ['pages', 'results', 'pages_per_sec', 'results_per_sec'])
+
+
+def scrape(engine, response, parse):
+    """Scrapes a results page the way a search does, and returns its items."""
+    document = parsers.Document(response.http, response.html, parse)
+    if not engine._is_ok(document):
+        raise RuntimeError(f'{engine.__class__.__name__} refused its fixture')
+    items = engine._filter_results(document)
+    engine._next_page(document)
+    return items
+
+
+def measure(engine_name, backend, seconds):
+    """
+    Scrapes the fixture of an engine repeatedly for about *seconds*.
+
+    :returns Throughput
+    """
+    engine = getattr(engines, engine_name)('benchmark')
+    engine.set_parser(backend)
+    engine.se_query = 'forestry'
+    parse = partial(engine._parse, region=engine._region())
+    html = (FIXTURES / ENGINE_FIXTURES[engine_name]).read_text(encoding='utf-8')
+    response = Response(200, html)
+
+    results = len(scrape(engine, response, parse))
+    if not results:
+        raise RuntimeError(f'{engine_name} found no results in its fixture')
+    pages = 0
+    start = perf_counter()
+    while True:
+        scrape(engine, response, parse)
+        pages += 1
+        elapsed = perf_counter() - start
+        if elapsed >= seconds and pages >= 3:
+            break
+    return Throughput(pages, results * pages, pages / elapsed, results * pages / elapsed)
+
+
+def load_baseline():
+    """Returns the baseline numbers, by engine and backend."""
+    if not BASELINE.is_file():
+        return {}
+    with open(BASELINE, encoding='utf-8') as _f:
+        return json.load(_f).get('engines', {})
+
+
+def save_baseline(numbers):
+    """Writes the numbers of this run to the baseline, replacing those
+    of the same engines and backends."""
+    engine_numbers = load_baseline()
+    for engine_name, backends in numbers.items():
+        engine_numbers.setdefault(engine_name, {}).update(backends)
+    baseline = {
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}',
+        'engines': engine_numbers,
+    }
+    with open(BASELINE, 'w', encoding='utf-8') as _f:
+        json.dump(baseline, _f, indent=2)
+        _f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline parse throughput of the engines.')
+    parser.add_argument('-s', '--seconds', type=float, default=1.0,
+                        help='seconds per engine and backend (default: %(default)s)')
+    parser.add_argument('-b', '--backend', action='append', choices=parsers.BACKENDS,
+                        help='parser backend to measure; all installed ones by default')
+    parser.add_argument('-e', '--engine', action='append', choices=list(ENGINE_FIXTURES),
+                        help='engine to measure; all by default')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25,
+                        help='flags runs slower than the baseline by this share'
+                             ' (default: %(default)s)')
+    parser.add_argument('--save', action='store_true',
+                        help='record this run as the baseline')
+    args = parser.parse_args()
+
+    backends = [b for b in (args.backend or parsers.BACKENDS) if parsers.is_available(b)]
+    baseline = load_baseline()
+    numbers = {}
+    regressions = 0
+
+    print(f'{"engine":<12}{"backend":<13}{"pages/s":>10}{"results/s":>12}{"baseline":>10}')
+    for engine_name in args.engine or ENGINE_FIXTURES:
+        numbers[engine_name] = {}
+        for backend in backends:
+            speed = measure(engine_name, backend, args.seconds)
+            numbers[engine_name][backend] = {
+                'pages_per_sec': round(speed.pages_per_sec, 1),
+                'results_per_sec': round(speed.results_per_sec, 1),
+            }
+            base = baseline.get(engine_name, {}).get(backend)
+            note = ''
+            if base:
+                change = speed.pages_per_sec / base['pages_per_sec'] - 1
+                note = f'{change:+.0%}'
+                if change < -args.tolerance:
+                    note += '  SLOWER'
+                    regressions += 1
+            print(f'{engine_name:<12}{backend:<13}{speed.pages_per_sec:>10.1f}'
+                  f'{speed.results_per_sec:>12.1f}{note:>10}')
+
+    if args.save:
+        save_baseline(numbers)
+        print(f'Baseline saved to {BASELINE.relative_to(ROOT)}')
+    elif regressions:
+        print(f'{regressions} run(s) slower than the baseline by more than {args.tolerance:.0%}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Measures the startup time of the command-line programs: informational
+runs that print and exit, and batch runs of no queries, which start the
+whole batch machinery but make no requests. Each command runs in a new
+interpreter several times; the best and median wall times are printed,
+with the bare interpreter startup for reference.
+
+Run from the repository root:
+    python benchmarks/startup.py [-r RUNS] [--imports]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    'python (bare)': ['-c', 'pass'],
+    'import search_engines': ['-c', 'import search_engines'],
+    'aggregate_search.py --help': ['aggregate_search.py', '--help'],
+    'aggregate_search.py --info': ['aggregate_search.py', '--info'],
+    'aggregate_search.py --batch -': ['aggregate_search.py', '--batch', '-'],
+    'search_engines_cli.py -h': ['search_engines_cli.py', '-h'],
+    'search_engines_cli.py -b -': ['search_engines_cli.py', '-b', '-'],
+}
+
+
+def time_command(args, runs):
+    """Returns the wall times, in seconds, of several runs of a command."""
+    times = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run(
+            [sys.executable, *args], cwd=ROOT, stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+        times.append(perf_counter() - start)
+    return times
+
+
+def slowest_imports(args, count=10):
+    """Returns the modules that took longest to import, with their
+    cumulative microseconds, from python -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args], cwd=ROOT,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, text=True, check=False
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imports.append((int(fields[1]), fields[2].strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Startup time of the programs.')
+    parser.add_argument('-r', '--runs', type=int, default=10,
+                        help='runs per command (default: %(default)d)')
+    parser.add_argument('--imports', action='store_true',
+                        help='also list the slowest imports of each command')
+    args = parser.parse_args()
+
+    print(f'{"command":<34}{"best ms":>10}{"median ms":>12}')
+    for name, command in COMMANDS.items():
+        times = time_command(command, args.runs)
+        print(f'{name:<34}{min(times) * 1000:>10.1f}'
+              f'{statistics.median(times) * 1000:>12.1f}')
+        if args.imports:
+            for micros, module in slowest_imports(command):
+                print(f'    {micros / 1000:>8.1f} ms  {module}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,18 @@
-from .engines import duckduckgo, metager, mojeek, startpage
+from importlib import import_module
 
 
 __title__ = 'search_engines'
 __version__ = '0.6'
 __author__ = 'Tasos M. Adamopoulos, modified by Craig S. Echt'
 
+# Engine modules, imported on first use.
+_ENGINE_MODULES = ('duckduckgo', 'metager', 'mojeek', 'startpage')
+
+
+def __getattr__(name):
+    """Imports an engine module on first use."""
+    if name not in _ENGINE_MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = import_module(f'.engines.{name}', __name__)
+    globals()[name] = module
+    return module
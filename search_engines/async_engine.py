@@ -0,0 +1,154 @@
+import asyncio
+
+from search_engines import config as cfg
+from search_engines import output as out
+from search_engines import utils
+from search_engines.async_http_client import AsyncHttpClient
+
+
+class AsyncSearchEngine:
+    """Runs a search engine on an asyncio event loop.
+
+    Wraps any SearchEngine subclass instance and reuses its hooks
+    (_selectors, _first_page, _next_page, _filter_results, _is_ok), so
+    engines need no async rewrite. The engine's requests session stays
+    the store of its headers and cookies; only the page requests go
+    through the AsyncHttpClient.
+    """
+    def __init__(self, engine, http_client=None):
+        """
+        :param SearchEngine engine: the engine, e.g. Mojeek(agent)
+        :param AsyncHttpClient http_client: optional, a client shared with
+            other engines; if not given, one is made for this engine.
+        """
+        self.engine = engine
+        self._owns_client = http_client is None
+        self._http_client = http_client or AsyncHttpClient(
+            engine._http_client.timeout, engine._http_client.proxy
+        )
+
+    @property
+    def results(self):
+        """The search results."""
+        return self.engine.results
+
+    @property
+    def is_banned(self):
+        """Indicates if a ban occured"""
+        return self.engine.is_banned
+
+    async def _get_page(self, page, data=None):
+        """Gets pagination links."""
+        engine = self.engine
+        session = engine._http_client.session
+        if engine._referer:
+            session.headers['Referer'] = engine._referer
+        headers = dict(session.headers)
+
+        if data:
+            response = await self._http_client.post(page, data, headers, session.cookies)
+        else:
+            response = await self._http_client.get(page, headers, session.cookies)
+        session.headers['Referer'] = page
+        return response
+
+    async def search(self, query, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES):
+        """
+        Queries the search engine, goes through the pages and collects
+        the results, without blocking the event loop.
+
+        :param query: str The search query
+        :param pages: int Optional, the maximum number of results pages
+            to search.
+        :returns SearchResults object
+        """
+        async for _ in self.iter_search(query, pages):
+            pass
+        return self.engine.results
+
+    async def iter_search(self, query, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES):
+        """
+        Queries the search engine and yields each new results item as
+        soon as its page is parsed, like SearchEngine.iter_search().
+        Stopping the iteration stops the search; use
+        contextlib.aclosing() to also end it right away.
+
+        :param query: str The search query
+        :param pages: int Optional, the maximum number of results pages
+            to search.
+        :returns async generator of results items
+        """
+        engine = self.engine
+        if not engine.quiet:
+            out.console(f'Searching {engine.__class__.__name__}')
+        engine.se_query = utils.decode_bytes(query)
+
+        loop = asyncio.get_running_loop()
+        request = None
+        pages = engine._admit(pages)
+
+        try:
+            for page in range(1, pages + 1):
+                try:
+                    response = engine._cached_page(page)
+                    is_cached = response is not None
+                    if not is_cached:
+                        if request is None:
+                            # Some engines fetch a landing page with their own
+                            #   blocking client, so keep that off the event loop.
+                            request = await loop.run_in_executor(None, engine._first_page)
+                        await asyncio.sleep(engine._rate_limit.reserve())
+                        response = await self._get_page(request['url'], request['data'])
+
+                    # Parsing is CPU work, and some engines request their
+                    #   next page URL (Metager), so keep both off the loop.
+                    request, items = await loop.run_in_executor(
+                        None, engine._process_page, response
+                    )
+                    if not is_cached:
+                        engine._record_health(request is not None)
+                    if request is None:
+                        break
+                    if not is_cached:
+                        engine._cache_page(page, response)
+
+                    if not engine.quiet:
+                        msg = f'{"page:".ljust(8)}{page}  links: {len(engine.results)}'
+                        out.console(msg, end='')
+                except TypeError:
+                    print('Internal error (async_engine.py)')
+                    break
+
+                for item in items:
+                    yield item
+                if not request['url']:
+                    break
+        finally:
+            engine._end_admission()
+            if not engine.quiet:
+                out.console('', end='')
+
+    async def close(self):
+        """Closes the HTTP client, if this engine made it."""
+        if self._owns_client:
+            await self._http_client.close()
+
+
+async def search_many(searches, http_client=None):
+    """Runs many searches concurrently on one event loop.
+
+    :param searches: list of (engine, query, pages) tuples. Each engine
+        collects its own results, so use one engine instance per query.
+    :param AsyncHttpClient http_client: optional, the client to share;
+        if not given, one is made and closed when all searches are done.
+    :returns list of SearchResults, in the order of *searches*.
+    """
+    client = http_client or AsyncHttpClient()
+    try:
+        return await asyncio.gather(*[
+            AsyncSearchEngine(engine, client).search(query, pages)
+            for engine, query, pages in searches
+        ])
+    finally:
+        if http_client is None:
+            await client.close()
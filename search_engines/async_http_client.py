@@ -0,0 +1,124 @@
+import asyncio
+from collections import Counter, namedtuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from search_engines import utils as utl
+from search_engines.config import TIMEOUT, PROXY, RETRIES, RETRY_STATUS
+from search_engines.http_client import HttpClient, backoff_delay
+from search_engines.http_client import CONNECT, READ, STATUS, FATAL
+
+
+def classify_error(error):
+    """Returns the class of an aiohttp exception: CONNECT, READ or FATAL."""
+    if isinstance(error, aiohttp.ClientSSLError):
+        return FATAL
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return CONNECT
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientPayloadError,
+                          aiohttp.ServerDisconnectedError)):
+        return READ
+    return FATAL
+
+
+class AsyncHttpClient:
+    """Performs asynchronous HTTP requests. An `aiohttp` wrapper.
+
+    One client holds one connection pool and can be shared by any number
+    of engines on the same event loop. It keeps no per-engine state:
+    headers and cookies are passed in with every request.
+    """
+    def __init__(self, timeout=TIMEOUT, proxy=PROXY, limit=100):
+        """
+        :param int timeout: optional, the HTTP timeout
+        :param str proxy: optional, a HTTP proxy server
+        :param int limit: optional, the maximum number of open connections
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncHttpClient requires aiohttp: pip install aiohttp')
+        if proxy and not utl.is_url(proxy):
+            raise ValueError('Invalid proxy format!')
+
+        self.timeout = timeout
+        self.proxy = proxy
+        self.limit = limit
+        self._session = None
+        self.response = namedtuple('response', ['http', 'html'])
+        self.retries = RETRIES
+        """The maximum number of retries of a failed request."""
+        self.retry_status = RETRY_STATUS
+        """The HTTP status codes that are retried."""
+        self.metrics = Counter()
+        """Counts of requests, retries and errors, as in HttpClient."""
+
+    async def get(self, page, headers=None, cookies=None):
+        """Submits a HTTP GET request.
+
+        :param str page: The URL
+        :param dict headers: optional, the request headers
+        :param cookies: optional, a cookie jar that is sent with the request
+            and updated with the response cookies.
+        """
+        return await self._request('GET', page, None, headers, cookies)
+
+    async def post(self, page, data, headers=None, cookies=None):
+        """Submits a HTTP POST request."""
+        return await self._request('POST', page, data, headers, cookies)
+
+    async def close(self):
+        """Closes the connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self):
+        """Returns the aiohttp session; it must be made in a running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def _request(self, method, page, data, headers, cookies):
+        """Submits a HTTP request and returns a (http, html) response.
+        Failed requests are retried like in HttpClient."""
+        page = HttpClient._quote(page)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.metrics['retries'] += 1
+                await asyncio.sleep(backoff_delay(attempt))
+            self.metrics['requests'] += 1
+            request_cookies = cookies.get_dict() if cookies is not None else None
+            try:
+                async with self._get_session().request(
+                        method, page, data=data, headers=headers,
+                        cookies=request_cookies, proxy=self.proxy) as req:
+                    html = await req.text(errors='replace')
+                    if cookies is not None:
+                        for name, morsel in req.cookies.items():
+                            cookies.set(name, morsel.value)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as _e:
+                error = classify_error(_e)
+                self.metrics[error] += 1
+                result = self.response(http=0, html=_e.__doc__)
+                if error == FATAL:
+                    break
+                continue
+
+            result = self.response(http=req.status, html=html)
+            if req.status not in self.retry_status:
+                return result
+            self.metrics[STATUS] += 1
+        self.metrics['failures'] += 1
+        return result
@@ -0,0 +1,154 @@
+"""
+Batch searches of many queries through several engines.
+"""
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import perf_counter
+
+from search_engines import config as cfg
+from search_engines import output as out
+
+BatchSummary = namedtuple(
+    'BatchSummary', ['queries', 'searches', 'pages', 'results', 'seconds']
+)
+
+
+def read_queries(path):
+    """
+    Returns the queries of a file, one per line, in file order and
+    without repeats. Blank lines and lines starting with '#' are skipped.
+
+    :param path: str The file path, or '-' to read standard input.
+    """
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding='utf-8') as _f:
+            lines = _f.read().splitlines()
+    queries = (line.strip() for line in lines)
+    return list(dict.fromkeys(
+        query for query in queries if query and not query.startswith('#')
+    ))
+
+
+class BatchSearch:
+    """
+    Searches many queries with several engines on a bounded pool of
+    worker threads. Each query and engine pair is one search, whose pages
+    are fetched in order. Searches of different engines run side by
+    side, and at most *per_engine* searches of one engine run at once;
+    their requests share the engine's rate limit. Searches are started
+    in query order, so queries complete roughly in the order they were
+    given.
+    """
+    def __init__(self, make_engine, engines, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES,
+                 workers=cfg.BATCH_WORKERS, per_engine=cfg.BATCH_PER_ENGINE):
+        """
+        :param make_engine: callable that takes an engine name and returns
+            a new, configured engine; it is called once per query and engine.
+        :param engines: list of engine names.
+        :param pages: int Optional, the maximum number of pages per search.
+        :param workers: int Optional, the maximum number of searches
+            running at once.
+        :param per_engine: int Optional, the maximum number of searches of
+            one engine running at once.
+        """
+        self._make_engine = make_engine
+        self.engines = list(dict.fromkeys(engines))
+        self.pages = pages
+        self.workers = max(1, workers)
+        self.per_engine = max(1, per_engine)
+        self.progress = True
+        """Prints the progress after each search."""
+
+    def run(self, queries, on_query=None, on_result=None):
+        """
+        Runs the searches of all queries.
+
+        :param queries: list of str The queries.
+        :param on_query: callable Optional, called in the calling thread
+            with the query and a list of (engine name, engine) pairs, in
+            engine order, when all engines have searched the query.
+        :param on_result: callable Optional, called in the worker threads
+            with the query, engine name and results item as soon as the
+            item is collected, e.g. a streaming writer's write().
+        :returns BatchSummary
+        """
+        queries = list(dict.fromkeys(queries))
+        order = {query: i for i, query in enumerate(queries)}
+        pending = {name: deque(queries) for name in self.engines}
+        running = dict.fromkeys(self.engines, 0)
+        rotation = deque(self.engines)
+        finished = {query: {} for query in queries}
+        futures = {}
+        totals = dict(queries=0, searches=0, pages=0, results=0)
+        start = perf_counter()
+
+        def dispatch():
+            """Starts searches until the pool or every engine is busy."""
+            while len(futures) < self.workers:
+                ready = [
+                    name for name in rotation
+                    if pending[name] and running[name] < self.per_engine
+                ]
+                if not ready:
+                    return
+                # The earliest query goes first; engines take turns on ties.
+                name = min(ready, key=lambda _n: order[pending[_n][0]])
+                rotation.remove(name)
+                rotation.append(name)
+
+                query = pending[name].popleft()
+                engine = self._make_engine(name)
+                running[name] += 1
+                future = executor.submit(self._search, engine, name, query, on_result)
+                futures[future] = (name, query, engine)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            dispatch()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, query, engine = futures.pop(future)
+                    running[name] -= 1
+                    try:
+                        future.result()
+                    except Exception as err:
+                        msg = f'{name} failed on "{query}": {err!r}'
+                        out.console(msg, level=out.Level.error)
+                    totals['searches'] += 1
+                    totals['pages'] += engine.page_count
+                    totals['results'] += len(engine.results)
+
+                    finished[query][name] = engine
+                    if len(finished[query]) == len(self.engines):
+                        totals['queries'] += 1
+                        engines = finished.pop(query)
+                        if on_query:
+                            on_query(query, [(_n, engines[_n]) for _n in self.engines])
+                dispatch()
+
+                if self.progress:
+                    out.console(
+                        f'queries: {totals["queries"]}/{len(queries)}  '
+                        f'searches: {totals["searches"]}  pages: {totals["pages"]}  '
+                        f'results: {totals["results"]}', end=''
+                    )
+        except KeyboardInterrupt:
+            # Only the main thread sees the interrupt, so stop the workers.
+            for _, _, engine in futures.values():
+                engine.stop()
+            out.console('User interrupted batch from keyboard.')
+        finally:
+            executor.shutdown(wait=True)
+        if self.progress:
+            out.console('')
+        return BatchSummary(seconds=perf_counter() - start, **totals)
+
+    def _search(self, engine, name, query, on_result):
+        """Runs one search, passing on each results item as it comes."""
+        for item in engine.iter_search(query, self.pages):
+            if on_result:
+                on_result(query, name, item)
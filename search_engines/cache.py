@@ -0,0 +1,134 @@
+"""
+Persistent on-disk cache of search results pages.
+"""
+import sqlite3
+import zlib
+from collections import namedtuple
+from pathlib import Path
+from threading import Lock
+from time import time
+
+from search_engines import config as cfg
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['path', 'pages', 'size', 'expired', 'engines', 'hits', 'misses']
+)
+
+
+class PageCache:
+    """
+    Stores the HTML of search results pages in a local SQLite database,
+    keyed on engine, normalized query, page number and filter operators.
+    Pages expire after *ttl* seconds; when there are more than *max_pages*
+    pages, the least recently used ones are evicted. One cache can be
+    shared by engines running in several threads.
+    """
+    def __init__(self, path=cfg.CACHE_PATH, ttl=cfg.CACHE_TTL, max_pages=cfg.CACHE_MAX_PAGES):
+        """
+        :param path: str or Path Optional, the database file.
+        :param ttl: int Optional, the seconds a page stays valid.
+        :param max_pages: int Optional, the maximum number of pages kept.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.refresh = False
+        """Ignores cached pages, but still stores the new ones."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self.response = namedtuple('response', ['http', 'html'])
+
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            'key TEXT PRIMARY KEY, engine TEXT, query TEXT, page INTEGER,'
+            ' http INTEGER, html BLOB, created REAL, accessed REAL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS accessed ON pages (accessed)')
+        self._db.commit()
+
+    @staticmethod
+    def normalize_query(query):
+        """Returns the query with its spaces and '+' separators collapsed."""
+        return ' '.join(query.replace('+', ' ').split())
+
+    def key(self, engine, query, page, filters=()):
+        """Returns the cache key of a results page."""
+        operators = ','.join(sorted(set(filters)))
+        return f'{engine.lower()}|{self.normalize_query(query)}|{page}|{operators}'
+
+    def get(self, engine, query, page, filters=()):
+        """
+        Returns a cached page as a (http, html) response, or None if
+        the page is not cached, has expired or the cache is refreshing.
+        """
+        key = self.key(engine, query, page, filters)
+        now = time()
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._db.execute(
+                    'SELECT http, html, created FROM pages WHERE key = ?', (key,)
+                ).fetchone()
+            if row is None or row[2] + self.ttl < now:
+                if row is not None:
+                    self._db.execute('DELETE FROM pages WHERE key = ?', (key,))
+                    self._db.commit()
+                self.misses += 1
+                return None
+            self._db.execute('UPDATE pages SET accessed = ? WHERE key = ?', (now, key))
+            self._db.commit()
+            self.hits += 1
+        return self.response(http=row[0], html=zlib.decompress(row[1]).decode('utf-8'))
+
+    def put(self, engine, query, page, response, filters=()):
+        """Stores a results page and evicts the least recently used pages."""
+        key = self.key(engine, query, page, filters)
+        html = zlib.compress(response.html.encode('utf-8'))
+        now = time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, engine.lower(), self.normalize_query(query), page,
+                 response.http, html, now, now)
+            )
+            self._db.execute(
+                'DELETE FROM pages WHERE key IN (SELECT key FROM pages'
+                ' ORDER BY accessed DESC LIMIT -1 OFFSET ?)', (self.max_pages,)
+            )
+            self._db.commit()
+
+    def purge(self):
+        """Deletes the expired pages."""
+        with self._lock:
+            self._db.execute('DELETE FROM pages WHERE created < ?', (time() - self.ttl,))
+            self._db.commit()
+
+    def clear(self):
+        """Deletes all the pages."""
+        with self._lock:
+            self._db.execute('DELETE FROM pages')
+            self._db.commit()
+            self._db.execute('VACUUM')
+
+    def info(self):
+        """Returns a CacheInfo summary of the cache."""
+        with self._lock:
+            pages, size = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(html)), 0) FROM pages'
+            ).fetchone()
+            expired, = self._db.execute(
+                'SELECT COUNT(*) FROM pages WHERE created < ?', (time() - self.ttl,)
+            ).fetchone()
+            engines = dict(self._db.execute(
+                'SELECT engine, COUNT(*) FROM pages GROUP BY engine'
+            ).fetchall())
+        return CacheInfo(str(self.path), pages, size, expired, engines, self.hits, self.misses)
+
+    def close(self):
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
@@ -6,6 +6,23 @@ SEARCH_ENGINE_RESULTS_PAGES = 10 # 20
 # HTTP request timeout
 TIMEOUT = 12
 
+# Connection pools, shared by all engines of the process: the number of
+#   hosts kept and connections per host, keep-alive of idle connections,
+#   and HTTP/2 where servers support it (requires: pip install httpx[http2]).
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+KEEP_ALIVE = True
+HTTP2 = False
+
+# Retries of failed requests: connection errors, read errors and these
+#   HTTP status codes. Bans (403, 429, 503) are not retried. The delay
+#   doubles from RETRY_BACKOFF seconds up to RETRY_MAX_BACKOFF, half of
+#   it random.
+RETRIES = 2
+RETRY_BACKOFF = 1.0
+RETRY_MAX_BACKOFF = 30.0
+RETRY_STATUS = (500, 502, 504)
+
 # Default User-Agent string
 # USER_AGENT = 'search_engines/0.5 Repo: https://github.com/tasos-py/Search-Engines-Scraper'
 USER_AGENT = 'nul'
@@ -14,8 +31,53 @@ USER_AGENT = 'nul'
 # FAKE_USER_AGENT = 'Mozilla/5.0 (Windows NT 6.1; rv:84.0) Gecko/20100101 Firefox/84.0'
 FAKE_USER_AGENT = 'nul'
 
+# HTML parser backend: 'html.parser', 'lxml' or 'selectolax'.
+# lxml and selectolax are much faster, but must be installed.
+HTML_PARSER = 'html.parser'
+
 # Proxy server
 PROXY = None
 
+# Results pages cache: off unless enabled here or from the command line.
+USE_CACHE = False
+CACHE_PATH = Path('search_engines/page_cache.sqlite').resolve()
+# Seconds a cached page stays valid, and the maximum number of pages kept.
+CACHE_TTL = 24 * 60 * 60
+CACHE_MAX_PAGES = 5000
+
+# Seconds that landing page form fields and tokens are reused.
+TOKEN_TTL = 30 * 60
+
+# Request rate limits, shared by all searches of an engine: at least
+#   'interval' seconds between requests plus up to 'jitter' random seconds,
+#   and 'burst' requests at once after a pause. Engines without an entry,
+#   keyed on class name (e.g. 'Startpage'), use 'default'.
+RATE_LIMITS = {
+    'default': {'interval': 1.0, 'jitter': 3.0, 'burst': 1},
+}
+# A folder to share the rate limits with other processes, or None.
+RATE_LIMIT_DIR = None
+
+# Engines that ban a request are skipped for HEALTH_BACKOFF seconds, then
+#   probed; each failed probe doubles the time, up to HEALTH_MAX_BACKOFF.
+HEALTH_FILE = Path('search_engines/engine_health.json').resolve()
+HEALTH_BACKOFF = 5 * 60
+HEALTH_MAX_BACKOFF = 6 * 60 * 60
+
+# Batch searches: the maximum number of searches running at once, and
+#   of searches of one engine.
+BATCH_WORKERS = 8
+BATCH_PER_ENGINE = 1
+
+# Stores the results of each engine column-wise, which takes the least
+#   memory when batch runs hold very many results.
+COLUMNAR_RESULTS = False
+
+# Parsed, quoted and unquoted URLs kept in memory, per kind.
+URL_CACHE_SIZE = 2 ** 14
+
+# Results written by the streaming output writers at a time.
+OUTPUT_BATCH_SIZE = 100
+
 # Path to output files
 OUTPUT_DIR = Path('search_engines/search_results/').resolve()
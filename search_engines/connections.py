@@ -0,0 +1,238 @@
+"""
+Connection pools shared by the HTTP clients of all engines.
+"""
+import socket
+import weakref
+from collections import namedtuple
+from http.client import HTTPMessage
+from threading import Lock
+from types import SimpleNamespace
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from urllib3.connection import HTTPConnection
+
+from search_engines import config as cfg
+from search_engines import output as out
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+PoolStats = namedtuple('PoolStats', ['protocol', 'requests', 'connections', 'reuse_rate'])
+
+# Headers of a HTTP/1.1 connection, which HTTP/2 forbids.
+HOP_BY_HOP_HEADERS = frozenset((
+    'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade',
+))
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    A requests adapter whose connection pools are shared by many
+    sessions, and kept open when a session is closed.
+    """
+    def __init__(self, pool_connections, pool_maxsize, keep_alive=True):
+        """
+        :param pool_connections: int The number of hosts to keep pools for.
+        :param pool_maxsize: int The connections kept per host.
+        :param keep_alive: bool Optional, turns on TCP keep-alive, so that
+            idle pooled connections are not dropped by routers.
+        """
+        self.keep_alive = keep_alive
+        super().__init__(pool_connections, pool_maxsize, pool_block=False)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keep_alive:
+            kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+    def close(self):
+        """Keeps the shared pools open; close_pools() closes them."""
+
+    def close_pools(self):
+        """Closes the connection pools."""
+        super().close()
+
+    def stats(self):
+        """Returns the PoolStats of the pools kept."""
+        count, connections = 0, 0
+        for manager in [self.poolmanager, *self.proxy_manager.values()]:
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    count += pool.num_requests
+                    connections += pool.num_connections
+        return _pool_stats('HTTP/1.1', count, connections)
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    A requests adapter that sends requests through an httpx transport,
+    over HTTP/2 when the server supports it. The requests session still
+    handles headers, cookies and redirects, so engines don't change.
+    """
+    def __init__(self, pool_connections, pool_maxsize, keep_alive=True):
+        """
+        :param pool_connections: int The number of hosts to keep pools for.
+        :param pool_maxsize: int The connections kept per host.
+        :param keep_alive: bool Optional, keeps idle connections open.
+        """
+        super().__init__()
+        connections = pool_connections * pool_maxsize
+        self._limits = httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections if keep_alive else 0,
+        )
+        self._transports = {}
+        self._lock = Lock()
+        self._seen = weakref.WeakSet()
+        self.requests = 0
+        self.connections = 0
+
+    def _transport(self, proxy):
+        """Returns the httpx transport of a proxy, or of direct requests."""
+        with self._lock:
+            transport = self._transports.get(proxy)
+            if transport is None:
+                transport = httpx.HTTPTransport(http2=True, limits=self._limits, proxy=proxy)
+                self._transports[proxy] = transport
+            return transport
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Sends a prepared request and returns a requests Response."""
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            timeout = httpx.Timeout(timeout)
+        headers = [
+            (name, value) for name, value in request.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        ]
+        transport = self._transport(select_proxy(request.url, proxies))
+        h_request = httpx.Request(
+            request.method, request.url, headers=headers, content=request.body,
+            extensions={'timeout': timeout.as_dict()}
+        )
+        try:
+            h_response = transport.handle_request(h_request)
+            try:
+                h_response.read()
+            finally:
+                h_response.close()
+        except httpx.ProxyError as _e:
+            raise requests.exceptions.ProxyError(_e, request=request)
+        except httpx.ConnectTimeout as _e:
+            raise requests.exceptions.ConnectTimeout(_e, request=request)
+        except httpx.TimeoutException as _e:
+            raise requests.exceptions.ReadTimeout(_e, request=request)
+        except httpx.NetworkError as _e:
+            raise requests.exceptions.ConnectionError(_e, request=request)
+        except httpx.HTTPError as _e:
+            raise requests.exceptions.RequestException(_e, request=request)
+        self._count(transport)
+        return self._build_response(request, h_response)
+
+    def _count(self, transport):
+        """Counts a request, and the connections opened for it."""
+        pool = getattr(transport, '_pool', None)
+        with self._lock:
+            self.requests += 1
+            for connection in getattr(pool, 'connections', ()):
+                if connection not in self._seen:
+                    self._seen.add(connection)
+                    self.connections += 1
+
+    def _build_response(self, request, h_response):
+        """Returns an httpx response as a requests Response."""
+        response = requests.Response()
+        response.status_code = h_response.status_code
+        response.reason = h_response.reason_phrase
+        response.headers = CaseInsensitiveDict(h_response.headers.multi_items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = h_response.content
+        response._content_consumed = True
+
+        # The session reads the response cookies from the raw response.
+        message = HTTPMessage()
+        for name, value in h_response.headers.multi_items():
+            message.add_header(name, value)
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=message))
+        return response
+
+    def close(self):
+        """Keeps the shared transports open; close_pools() closes them."""
+
+    def close_pools(self):
+        """Closes the httpx transports."""
+        with self._lock:
+            for transport in self._transports.values():
+                transport.close()
+            self._transports.clear()
+
+    def stats(self):
+        """Returns the PoolStats of the transports."""
+        with self._lock:
+            return _pool_stats('HTTP/2', self.requests, self.connections)
+
+
+def _pool_stats(protocol, count, connections):
+    """Returns PoolStats with the share of requests sent on reused connections."""
+    reuse_rate = 1 - connections / count if count else 0.0
+    return PoolStats(protocol, count, connections, max(0.0, reuse_rate))
+
+
+class ConnectionManager:
+    """
+    Holds the connection pools of the process. Every session mounted on
+    the manager sends its requests through the same pools, so connections
+    to an engine are reused by all its searches, skipping new DNS, TCP and
+    TLS handshakes. Sessions keep their own headers and cookies.
+    """
+    def __init__(self, pool_connections=cfg.POOL_CONNECTIONS, pool_maxsize=cfg.POOL_MAXSIZE,
+                 keep_alive=cfg.KEEP_ALIVE, http2=cfg.HTTP2):
+        """
+        :param pool_connections: int Optional, the number of hosts to keep
+            pools for.
+        :param pool_maxsize: int Optional, the connections kept per host.
+        :param keep_alive: bool Optional, keeps connections open between
+            requests; if False, every request opens a new connection.
+        :param http2: bool Optional, uses HTTP/2 where servers support it;
+            requires httpx with h2.
+        """
+        if http2 and httpx is None:
+            msg = 'HTTP/2 requires httpx: pip install httpx[http2]'
+            out.console(msg, level=out.Level.warning)
+            http2 = False
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        adapter = Http2Adapter if http2 else PooledAdapter
+        self._adapter = adapter(pool_connections, pool_maxsize, keep_alive)
+
+    def mount(self, session):
+        """Makes a requests session use the shared pools."""
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+    def stats(self):
+        """Returns the PoolStats: requests sent, connections opened and
+        the share of requests that reused an open connection."""
+        return self._adapter.stats()
+
+    def close(self):
+        """Closes all pooled connections."""
+        self._adapter.close_pools()
+
+
+pools = ConnectionManager()
+"""The connection pools shared by all engines of the process."""
@@ -0,0 +1,94 @@
+"""
+Cross-engine deduplication of search results by canonical URL.
+"""
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that only track the visit and never change the page.
+TRACKING_PARAMS = frozenset((
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_hsenc', '_hsmi', 'ref_src',
+))
+TRACKING_PREFIXES = ('utm_',)
+
+# Redirect wrappers of engines: host -> query parameter of the target URL.
+REDIRECT_PARAMS = {
+    'duckduckgo.com': 'uddg',
+    'links.duckduckgo.com': 'uddg',
+    'startpage.com': 'url',
+    'eu.startpage.com': 'url',
+    'us.startpage.com': 'url',
+}
+
+
+def _is_tracking(param):
+    """Checks if a query parameter is a tracking parameter."""
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=2 ** 16)
+def canonical_url(url):
+    """
+    Returns the canonical key of a URL, so that variants of the same
+    page compare equal: the scheme, 'www.', default ports, trailing
+    slashes, fragments, tracking parameters and engine redirect
+    wrappers are dropped, and the remaining parameters are sorted.
+
+    :param url: str The URL.
+    :returns str The canonical key; not itself a usable URL.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    target = REDIRECT_PARAMS.get(host)
+    if target:
+        for name, value in params:
+            if name == target and value.startswith(('http://', 'https://')):
+                return canonical_url(value)
+
+    netloc = f'{host}:{port}' if port not in (None, 80, 443) else host
+    path = parts.path.rstrip('/')
+    query = urlencode(sorted(
+        (name, value) for name, value in params if not _is_tracking(name)
+    ))
+    return f'{netloc}{path}?{query}' if query else f'{netloc}{path}'
+
+
+def merge_results(engine_results, keep='first'):
+    """
+    Merges the results of several engines in one hash-based pass, in
+    linear time. Results with the same canonical URL are merged into one
+    item, whose 'engines' key lists the engines that returned it.
+
+    :param engine_results: iterable of (engine name, results items) pairs,
+        in engine order.
+    :param keep: str 'first' keeps the data of the first duplicate found,
+        'last' the data of the last one. Either way, the merged item keeps
+        the position of the first duplicate.
+    :returns list of results items (dict copies).
+    """
+    if keep not in ('first', 'last'):
+        raise ValueError(f'Unsupported keep option "{keep}"')
+    merged = {}
+
+    for name, items in engine_results:
+        for item in items:
+            key = canonical_url(item['link'])
+            found = merged.get(key)
+            if found is None:
+                merged[key] = dict(item, engines=[name])
+                continue
+            engines = found['engines']
+            if name not in engines:
+                engines.append(name)
+            if keep == 'last':
+                merged[key] = dict(item, engines=engines)
+    return list(merged.values())
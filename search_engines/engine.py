@@ -1,28 +1,35 @@
-from random import uniform as random_uniform
-from time import sleep
-
-from bs4 import BeautifulSoup
+from functools import partial
+from threading import Event
+from time import perf_counter
 
 from search_engines import config as cfg
 from search_engines import output as out
+from search_engines import parsers
 from search_engines import utils
+from search_engines import health
+from search_engines.rate_limit import rate_limiter
+from search_engines.tokens import landing_tokens
 from search_engines.http_client import HttpClient
-from search_engines.results import SearchResults
+from search_engines.results import ResultItem, SearchResults
 
 
 class SearchEngine:
     """The base class for all Search Engines."""
+    _selector_plans = {}
+    """Compiled results selectors, per engine class and parser backend."""
+
     def __init__(self, proxy=cfg.PROXY, timeout=cfg.TIMEOUT):
         """
         :param str proxy: optional, a proxy server
         :param int timeout: optional, the HTTP timeout
         """
         self._http_client = HttpClient(timeout, proxy)
-        self._delay = (1, 4)
+        self._rate_limit = rate_limiter(self.__class__.__name__)
+        """The TokenBucket that paces requests to the engine."""
         self.se_query = ''
         self.se_filters = []
 
-        self.results = SearchResults()
+        self.results = SearchResults(columnar=cfg.COLUMNAR_RESULTS)
         """The search results."""
         self.ignore_duplicate_urls = False
         """Collects only unique URLs."""
@@ -30,38 +37,122 @@ class SearchEngine:
         """Collects only unique domains."""
         self.is_banned = False
         """Indicates if a ban occured"""
+        self.parser = parsers.HTML_PARSER
+        """The HTML parser backend."""
+        self.parse_time = 0.0
+        """Seconds spent parsing HTML pages."""
+        self.parse_count = 0
+        """The number of HTML pages parsed."""
+        self.page_count = 0
+        """The number of results pages processed."""
+        self.quiet = False
+        """Suppresses the search progress messages."""
+        self.cache = None
+        """An optional PageCache of results pages."""
+        self.token_cache = landing_tokens
+        """The TokenCache of landing page tokens, or None to always fetch them."""
+        self.health = health.engine_health
+        """The EngineHealth that skips banned engines, or None to never skip."""
+        self._probe = False
+        """Indicates that this search probes the engine's half-open breaker."""
+        self.set_parser(cfg.HTML_PARSER)
+        self._stopped = Event()
+        # Retries of failed requests stop with the search, and keep to
+        #   the engine's rate limit.
+        self._http_client.stopped = self._stopped
+        self._http_client.rate_limit = self._rate_limit
+        self._referer = None
+        """A fixed Referer header for page requests, if the engine needs one."""
 
     @staticmethod
     def _selectors(element, **kwargs):
         """Returns the appropriate CSS selector."""
         raise NotImplementedError()
 
+    def _region(self):
+        """Returns the class names of the page elements that hold the
+        results and pagination, or None to parse the whole page."""
+        try:
+            return self._selectors('region')
+        except KeyError:
+            return None
+
     def _first_page(self):
         """Returns the initial page URL."""
         raise NotImplementedError()
 
+    def _landing_key(self):
+        """Returns the token cache key of the engine's landing page data."""
+        agent = self._http_client.session.headers.get('User-Agent')
+        return self.__class__.__name__, agent, self._landing_scope()
+
+    def _landing_scope(self):
+        """Returns what the landing page tokens are bound to, besides the
+        engine and user agent; tokens of all queries are shared by default."""
+        return ''
+
+    def _cached_landing(self):
+        """Returns the cached landing page data, or None.
+        The cookies that came with the data are restored to the session.
+        """
+        if self.token_cache is None:
+            return None
+        landing = self.token_cache.get(self._landing_key())
+        if landing is None:
+            return None
+        self._http_client.session.cookies.update(landing['cookies'])
+        return landing['data']
+
+    def _cache_landing(self, data):
+        """Stores landing page data with the current session cookies."""
+        if self.token_cache is not None and data:
+            cookies = self._http_client.session.cookies.get_dict()
+            self.token_cache.put(self._landing_key(), {'data': data, 'cookies': cookies})
+
+    def _invalidate_landing(self):
+        """Forgets the cached landing page data, e.g. when it is stale."""
+        if self.token_cache is not None:
+            self.token_cache.invalidate(self._landing_key())
+
     def _next_page(self, tags):
         """Returns the next page URL and post data."""
         raise NotImplementedError()
 
+    def _selector_plan(self):
+        """Returns the compiled 'parent', 'url', 'title' and 'text' selectors.
+        They are compiled once per engine class and parser backend, and
+        reused by all instances and searches.
+        """
+        key = (self.__class__, self.parser)
+        plan = SearchEngine._selector_plans.get(key)
+        if plan is None:
+            plan = {
+                element: parsers.CompiledSelector(self._selectors(element), self.parser)
+                for element in ('parent', 'url', 'title', 'text')
+            }
+            SearchEngine._selector_plans[key] = plan
+        return plan
+
     def _get_url(self, tag, item='href'):
         """Returns the URL of search results items."""
-        selector = self._selectors('url')
-        url = self._get_tag_item(tag.select_one(selector), item)
+        selector = self._selector_plan()['url']
+        url = self._get_tag_item(selector.select_one(tag), item)
         return utils.unquote_url(url)
 
     def _get_title(self, tag, item='text'):
         """Returns the title of search results items."""
-        selector = self._selectors('title')
-        return self._get_tag_item(tag.select_one(selector), item)
+        selector = self._selector_plan()['title']
+        return self._get_tag_item(selector.select_one(tag), item)
 
     def _get_text(self, tag, item='text'):
         """Returns the text of search results items."""
-        selector = self._selectors('text')
-        return self._get_tag_item(tag.select_one(selector), item)
+        selector = self._selector_plan()['text']
+        return self._get_tag_item(selector.select_one(tag), item)
 
     def _get_page(self, page, data=None):
         """Gets pagination links."""
+        if self._referer:
+            self._http_client.session.headers['Referer'] = self._referer
         if data:
             return self._http_client.post(page, data)
         return self._http_client.get(page)
@@ -75,12 +166,13 @@ class SearchEngine:
 
     def _item(self, link):
         """Returns a dictionary of the link data."""
-        return {
-            'host': utils.domain(self._get_url(link)),
-            'link': self._get_url(link),
-            'title': self._get_title(link).strip(),
-            'text': self._get_text(link).strip()
-        }
+        url = self._get_url(link)
+        return ResultItem(
+            host=utils.domain(url),
+            link=url,
+            title=self._get_title(link).strip(),
+            text=self._get_text(link).strip()
+        )
 
     def _query_in(self, item):
         """Checks if query is contained in the item."""
@@ -88,7 +180,7 @@ class SearchEngine:
 
     def _filter_results(self, soup):
         """Processes and filters the search results."""
-        tags = soup.select(self._selectors('parent'))
+        tags = self._selector_plan()['parent'].select(soup)
         results = [self._item(link) for link in tags]
 
         if 'url' in self.se_filters:
@@ -98,21 +190,29 @@ class SearchEngine:
         if 'text' in self.se_filters:
             results = [_l for _l in results if self._query_in(_l['text'])]
         if 'host' in self.se_filters:
-            results = [_l for _l in results if self._query_in(utils.domain(_l['link']))]
+            hosts = utils.process_links(_l['link'] for _l in results)
+            results = [_l for _l, _h in zip(results, hosts) if self._query_in(_h.domain)]
         return results
 
     def _collect_results(self, items):
-        """Collects the search results items."""
-        for item in items:
-            if not utils.is_url(item['link']):
+        """Collects the search results items.
+
+        :returns list The items that were new to the results.
+        """
+        collected = []
+        links = utils.process_links(item['link'] for item in items)
+        for item, link in zip(items, links):
+            if not (link.scheme and link.netloc):
                 continue
             if item in self.results:
                 continue
-            if self.ignore_duplicate_urls and item['link'] in self.results.links():
+            if self.ignore_duplicate_urls and self.results.has_link(item['link']):
                 continue
-            if self.ignore_duplicate_domains and item['host'] in self.results.hosts():
+            if self.ignore_duplicate_domains and self.results.has_host(item['host']):
                 continue
             self.results.append(item)
+            collected.append(item)
+        return collected
 
     def _is_ok(self, response):
         """Checks if the HTTP response is 200 OK."""
@@ -131,6 +231,22 @@ class SearchEngine:
         """
         self._http_client.session.headers.update(headers)
 
+    def set_parser(self, parser):
+        """Sets the HTML parser backend.
+        Supported parsers: 'html.parser', 'lxml', 'selectolax'
+
+        :param parser: str The parser name
+        """
+        parser = (parser or parsers.HTML_PARSER).lower()
+        if parser not in parsers.BACKENDS:
+            msg = f'Ignoring unsupported parser "{parser}"'
+            out.console(msg, level=out.Level.warning)
+        elif not parsers.is_available(parser):
+            msg = f'Parser "{parser}" is not installed, using "{self.parser}"'
+            out.console(msg, level=out.Level.warning)
+        else:
+            self.parser = parser
+
     def set_search_operator(self, operator):
         """Filters search results based on the operator.
         Supported operators: 'url', 'title', 'text', 'host'
@@ -147,6 +263,95 @@ class SearchEngine:
             else:
                 self.se_filters += [_op]
 
+    def _parse(self, html, region=None):
+        """Parses an HTML page with the engine's parser backend.
+
+        :param html: str The page source.
+        :param region: Optional, the class names of the elements to parse;
+            the rest of the page is skipped.
+        """
+        start = perf_counter()
+        document = parsers.parse(html, self.parser, region)
+        self.parse_time += perf_counter() - start
+        self.parse_count += 1
+        return document
+
+    def _process_page(self, response):
+        """Parses a results page and collects its items.
+
+        :param response: The HTTP response of the page.
+        :returns tuple The next page request, or None if the response
+            was not OK, and the list of new results items.
+        """
+        # The hooks share one document, so the page is parsed at most once,
+        #   and only if a hook needs the DOM.
+        parse = partial(self._parse, region=self._region())
+        document = parsers.Document(response.http, response.html, parse)
+        if not self._is_ok(document):
+            # The page may have been refused for a stale landing token.
+            self._invalidate_landing()
+            return None, []
+        self.page_count += 1
+        items = self._filter_results(document)
+
+        collected = self._collect_results(items)
+        return self._next_page(document), collected
+
+    def _cached_page(self, page):
+        """Returns the cached response of a results page, or None."""
+        if self.cache is None:
+            return None
+        engine = self.__class__.__name__
+        return self.cache.get(engine, self.se_query, page, self.se_filters)
+
+    def _cache_page(self, page, response):
+        """Stores the response of a results page in the cache."""
+        if self.cache is not None:
+            engine = self.__class__.__name__
+            self.cache.put(engine, self.se_query, page, response, self.se_filters)
+
+    def _admit(self, pages):
+        """Returns the number of pages the engine may search: none while it
+        backs off from a ban, one to probe if the ban is over, else *pages*.
+        """
+        if self.health is None:
+            return pages
+        name = self.__class__.__name__
+        state = self.health.admit(name)
+        self._probe = state == health.HALF_OPEN
+        if state is None:
+            self.is_banned = True
+            minutes = self.health.retry_in(name) / 60
+            msg = f'Skipping {name}, banned; next try in {minutes:.0f} min'
+            out.console(msg, level=out.Level.warning)
+            return 0
+        return 1 if state == health.HALF_OPEN else pages
+
+    def _record_health(self, is_ok):
+        """Records a ban, or a page that was not banned, for the engine."""
+        if self.health is None:
+            return
+        if self.is_banned:
+            self.health.record(self.__class__.__name__, banned=True, probe=self._probe)
+        elif is_ok:
+            self.health.record(self.__class__.__name__, banned=False, probe=self._probe)
+        else:
+            return
+        # The probe ends with its request.
+        self._probe = False
+
+    def _end_admission(self):
+        """Ends a probe search that made no request."""
+        if self._probe:
+            self._probe = False
+            self.health.release(self.__class__.__name__)
+
+    def stop(self):
+        """Stops a running search after the current page.
+        Used to interrupt searches that run in worker threads.
+        """
+        self._stopped.set()
+
     def search(self, query, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES):
         """
         Queries the search engine, goes through the pages and  collects
@@ -157,36 +362,73 @@ class SearchEngine:
             to search.
         :returns SearchResults object
         """
-        out.console(f'Searching {self.__class__.__name__}')
-        self.se_query = utils.decode_bytes(query)
-        request = self._first_page()
-
-        for page in range(1, pages + 1):
-            try:
-                response = self._get_page(request['url'], request['data'])
-                if not self._is_ok(response):
-                    break
-                tags = BeautifulSoup(response.html, "html.parser")
-                items = self._filter_results(tags)
+        for _ in self.iter_search(query, pages):
+            pass
+        return self.results
 
-                self._collect_results(items)
+    def iter_search(self, query, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES):
+        """
+        Queries the search engine and yields each new results item as
+        soon as its page is parsed. The items are also collected in
+        self.results. The next page is only fetched when the items of
+        the current page have been consumed, so stopping the iteration
+        stops the search.
 
-                msg = f'{"page:".ljust(8)}{page}  links: {len(self.results)}'
-                out.console(msg, end='')
-                request = self._next_page(tags)
+        :param query: str The search query
+        :param pages: int Optional, the maximum number of results pages
+            to search.
+        :returns generator of results items
+        """
+        if not self.quiet:
+            out.console(f'Searching {self.__class__.__name__}')
+        self.se_query = utils.decode_bytes(query)
+        self._stopped.clear()
+        request = None
+        pages = self._admit(pages)
+
+        try:
+            for page in range(1, pages + 1):
+                try:
+                    # Cached pages skip both the request and its rate limit.
+                    response = self._cached_page(page)
+                    is_cached = response is not None
+                    if not is_cached:
+                        if request is None:
+                            request = self._first_page()
+                        # The wait for a request turn is cut short by stop().
+                        if self._stopped.wait(self._rate_limit.reserve()):
+                            break
+                        response = self._get_page(request['url'], request['data'])
+
+                    request, items = self._process_page(response)
+                    if not is_cached:
+                        self._record_health(request is not None)
+                    if request is None:
+                        break
+                    if not is_cached:
+                        self._cache_page(page, response)
+
+                    if not self.quiet:
+                        msg = f'{"page:".ljust(8)}{page}  links: {len(self.results)}'
+                        out.console(msg, end='')
+                except KeyboardInterrupt:
+                    print('User interrupted search from keyboard.')
+                    break
+                except TypeError:
+                    print('Internal error (engine.py)')
+                    break
 
+                yield from items
                 if not request['url']:
                     break
-                if page < pages:
-                    sleep(random_uniform(*self._delay))
-            except KeyboardInterrupt:
-                print('User interrupted search from keyboard.')
-                break
-            except TypeError:
-                print('Internal error (engine.py)')
-                break
-        out.console('', end='')
-        return self.results
+        finally:
+            self._end_admission()
+            if not self.quiet:
+                out.console('', end='')
+
+    def print_parse_times(self):
+        """Prints the time spent parsing HTML pages."""
+        out.print_parse_times([self])
 
     def output(self, output=out.PRINT, path=None):
         """Prints search results and/or creates report files.
@@ -199,12 +441,4 @@ class SearchEngine:
         if not path:
             path = str(cfg.OUTPUT_DIR) + '_'.join(self.se_query.split())
         out.console('')
-
-        if out.PRINT in output:
-            out.print_results([self])
-        if out.HTML in output:
-            out.write_file(out.create_html_data([self]), path + '.html')
-        if out.CSV in output:
-            out.write_file(out.create_csv_data([self]), path + '.csv')
-        if out.JSON in output:
-            out.write_file(out.create_json_data([self]), path + '.json')
+        out.write_results([self], output, path)
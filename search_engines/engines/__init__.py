@@ -1,12 +1,97 @@
+"""
+The search engines. Engine classes are imported on first use, so that
+importing the package doesn't import every engine with its parser and
+HTTP dependencies. Engines of other packages are added through the
+'search_engines.engines' entry point group, e.g. in their setup.py:
 
-from .duckduckgo import Duckduckgo
-from .mojeek import Mojeek
-from .startpage import Startpage
-from .metager import Metager
+    entry_points={'search_engines.engines': ['bing = my_engines.bing:Bing']}
+"""
+from collections.abc import Mapping
+from importlib import import_module
 
-search_engines_dict = { 
-    'duckduckgo': Duckduckgo,
-    'startpage': Startpage,
-    # 'metager': Metager,
-    'mojeek': Mojeek,
+ENTRY_POINT_GROUP = 'search_engines.engines'
+
+# The engine classes of this package, and their modules.
+_MODULES = {
+    'Duckduckgo': 'duckduckgo',
+    'Mojeek': 'mojeek',
+    'Startpage': 'startpage',
+    'Metager': 'metager',
 }
+
+
+def __getattr__(name):
+    """Imports an engine class of this package on first use."""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    engine = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = engine
+    return engine
+
+
+def _entry_points():
+    """Returns the entry points of engines of other packages."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return []
+    points = entry_points()
+    if hasattr(points, 'select'):
+        return list(points.select(group=ENTRY_POINT_GROUP))
+    return list(points.get(ENTRY_POINT_GROUP, ()))
+
+
+class EngineRegistry(Mapping):
+    """
+    Maps engine names to engine classes, importing each class when it is
+    first looked up. The engines of this package come first; those of
+    entry points are found when first needed, and can't replace them.
+    """
+    def __init__(self, engines):
+        """
+        :param engines: dict of engine name: class name in this package.
+        """
+        self._engines = dict(engines)
+        self._plugins = None
+        self._loaded = {}
+
+    def _plugin_points(self):
+        """Returns the entry points of other packages, by engine name."""
+        if self._plugins is None:
+            self._plugins = {}
+            for point in _entry_points():
+                name = point.name.lower()
+                if name not in self._engines:
+                    self._plugins.setdefault(name, point)
+        return self._plugins
+
+    def __getitem__(self, name):
+        if name in self._engines:
+            return __getattr__(self._engines[name])
+        engine = self._loaded.get(name)
+        if engine is None:
+            point = self._plugin_points().get(name)
+            if point is None:
+                raise KeyError(name)
+            # Entry points are loaded once.
+            engine = self._loaded[name] = point.load()
+        return engine
+
+    def __contains__(self, name):
+        return name in self._engines or name in self._plugin_points()
+
+    def __iter__(self):
+        yield from self._engines
+        yield from self._plugin_points()
+
+    def __len__(self):
+        return len(self._engines) + len(self._plugin_points())
+
+
+search_engines_dict = EngineRegistry({
+    'duckduckgo': 'Duckduckgo',
+    'startpage': 'Startpage',
+    # 'metager': 'Metager',
+    'mojeek': 'Mojeek',
+})
@@ -1,11 +1,22 @@
 import json
 import re
 
-from bs4 import BeautifulSoup
-
 from .. import utils
 from ..config import PROXY, TIMEOUT
 from ..engine import SearchEngine
+from ..results import ResultItem
+
+# DuckDuckGo results are JavaScript, not HTML, so its pages are never
+#   parsed into a DOM; these precompiled patterns do all the work.
+PATTERNS = {
+    'first_page': re.compile(r'DDG\.deep\.initialize\(\'(.*?)\'\)'),
+    'next_page': re.compile(r'"n"\:\s*"(/d\.js.*?)"'),
+    # Matches up to the results array, which is then decoded in place.
+    'results': re.compile(r"DDG\.pageLayout\.load\('d'\,\s*(?=\[)"),
+}
+
+# Control characters (raw newlines) are allowed inside the JSON strings.
+JSON_DECODER = json.JSONDecoder(strict=False)
 
 
 class Duckduckgo(SearchEngine):
@@ -15,51 +26,50 @@ class Duckduckgo(SearchEngine):
         super().__init__(proxy, timeout)
         self._base_url = 'https://links.duckduckgo.com{}&biaexp=b&msvrtexp=b&videxp=a&nadse=b&tjsexp=b'
         self._main_url = 'https://duckduckgo.com/?q={}&t=h_'
-        self._current_page = None
+        self._referer = 'https://duckduckgo.com/'
         self.set_headers({'User-Agent': user_agent})
 
     @staticmethod
     def _selectors(element, **kwargs):
-        """Returns the appropriate CSS selector - regex pattern, in this case."""
-        selectors = {
-            'first_page': r'DDG\.deep\.initialize\(\'(.*?)\'\)',
-            'next_page': r'"n"\:\s*"(/d\.js.*?)"',
-            'results': r"DDG\.pageLayout\.load\('d'\,\s*(\[.*?\])\s*\);"
-        }
-        return selectors[element]
+        """Returns the appropriate CSS selector - compiled regex pattern, in this case."""
+        return PATTERNS[element]
+
+    def _landing_scope(self):
+        """The results URL of the landing page has a per-query token."""
+        return ' '.join(self.se_query.replace('+', ' ').split())
 
     def _first_page(self):
         """Returns the initial page and query."""
-        res = self._http_client.get(self._main_url.format(self.se_query))
-        match = re.search(self._selectors('first_page'), res.html)
-        if match:
-            return {'url': self._base_url.format(match.group(1)), 'data': None}
-        return {'url': None, 'data': None}
+        path = self._cached_landing()
+        if path is None:
+            res = self._http_client.get(self._main_url.format(self.se_query))
+            match = self._selectors('first_page').search(res.html)
+            if not match:
+                return {'url': None, 'data': None}
+            path = match.group(1)
+            self._cache_landing(path)
+        return {'url': self._base_url.format(path), 'data': None}
 
     def _next_page(self, tags):
         """Returns the next page URL and post data (if any)"""
-        match = re.search(self._selectors('next_page'), tags.get_text())
+        match = self._selectors('next_page').search(tags.html)
         if match:
             return {'url': self._base_url.format(match.group(1)), 'data': None}
         return {'url': None, 'data': None}
 
-    def _get_page(self, page, data=None):
-        """Gets pagination links."""
-        self._http_client.session.headers['Referer'] = 'https://duckduckgo.com/'
-        response = self._http_client.get(page)
-        self._current_page = response.html
-        return response
-
     def _filter_results(self, soup):
         """Processes and filters the search results."""
-        match = re.search(self._selectors('results'), self._current_page)
+        match = self._selectors('results').search(soup.html)
         if not match:
             return {}
-        data = json.loads(re.sub('\n|\r', '', match.group(1)))[:-1]
+        try:
+            data, _ = JSON_DECODER.raw_decode(soup.html, match.end())
+        except ValueError:
+            return {}
+        # The last item is the pagination data, not a result.
         results = [
-            {'link': i['u'], 'title': i['t'],
-             'text': BeautifulSoup(i['a'], 'html.parser').get_text()}
-            for i in data
+            ResultItem(utils.domain(i['u']), i['u'], i['t'], utils.strip_tags(i['a']))
+            for i in data[:-1]
         ]
 
         if 'url' in self.se_filters:
@@ -69,5 +79,6 @@ class Duckduckgo(SearchEngine):
         if 'text' in self.se_filters:
             results = [_l for _l in results if self._query_in(_l['text'])]
         if 'host' in self.se_filters:
-            results = [_l for _l in results if self._query_in(utils.domain(_l['link']))]
+            hosts = utils.process_links(_l['link'] for _l in results)
+            results = [_l for _l, _h in zip(results, hosts) if self._query_in(_h.domain)]
         return results
@@ -17,7 +17,8 @@ class Mojeek(SearchEngine):
             'title': 'a.ob[href]',
             'text': 'p.s',
             'parent': 'ul.results-standard > li',
-            'next': {'href': 'div.pagination li a[href]', 'text': 'Next'}
+            'next': {'href': 'div.pagination li a[href]', 'text': 'Next'},
+            'region': ('results-standard', 'pagination'),
         }
         return selectors[element]
 
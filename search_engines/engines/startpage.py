@@ -1,5 +1,3 @@
-from bs4 import BeautifulSoup
-
 from search_engines.engine import SearchEngine
 from search_engines.config import PROXY, TIMEOUT
 from search_engines import output as out
@@ -23,21 +21,30 @@ class Startpage(SearchEngine):
             'parent': 'section.w-gl div.w-gl__result',
             'next': {'form': 'form.pagination__form', 'text': 'Next'},
             'search_form': 'form#search input[name]',
-            'blocked_form': 'form#blocked_feedback_form'
+            'blocked_form': 'form#blocked_feedback_form',
+            'region': ('w-gl', 'pagination__form'),
         }
         return selectors[element]
     
     def _first_page(self):
         """Returns the initial page and query."""
-        response = self._get_page(self._base_url)
-        tags = BeautifulSoup(response.html, "html.parser")
-        selector = self._selectors('search_form')
+        # The hidden search form fields are reused from earlier searches
+        #   until they expire or Startpage refuses them.
+        data = self._cached_landing()
+        if data is None:
+            response = self._get_page(self._base_url)
+            tags = self._parse(response.html)
+            selector = self._selectors('search_form')
 
-        data = {
-            i['name']: i.get('value', '') 
-            for i in tags.select(selector)
-        }
-        data['query'] = self.se_query
+            data = {
+                i['name']: i.get('value', '')
+                for i in tags.select(selector)
+            }
+            self._cache_landing(data)
+        else:
+            self._http_client.session.headers['Referer'] = self._base_url
+
+        data = dict(data, query=self.se_query)
         url = self._base_url + '/sp/search'
         return {'url': url, 'data': data}
     
@@ -60,9 +67,11 @@ class Startpage(SearchEngine):
     
     def _is_ok(self, response):
         """Checks if the HTTP response is 200 OK."""
-        soup = BeautifulSoup(response.html, 'html.parser')
         selector = self._selectors('blocked_form')
-        is_blocked = soup.select_one(selector)
+        # The form is outside the results region, so look for it in the
+        #   whole page, which is only parsed if the form's id is there.
+        is_blocked = ('blocked_feedback_form' in response.html
+                      and self._parse(response.html).select_one(selector))
         
         self.is_banned = response.http in [403, 429, 503] or is_blocked
         
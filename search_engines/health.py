@@ -0,0 +1,154 @@
+"""
+Circuit breakers that keep banned engines from being searched.
+"""
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from time import time
+
+from search_engines import config as cfg
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class EngineHealth:
+    """
+    Tracks the bans of each engine with a circuit breaker:
+
+    - closed: the engine is searched normally.
+    - open: the engine banned a request, so its searches are skipped
+      until the backoff time has passed.
+    - half-open: the backoff has passed; one search may probe a single
+      page. If it's banned again, the breaker opens for twice as long,
+      up to *max_backoff*; otherwise it closes.
+
+    Only bans count (HTTP 403, 429, 503 or an engine's block page), not
+    other errors. The state is saved to a JSON file, so that a new process
+    knows the bans of earlier ones. Thread-safe.
+    """
+    def __init__(self, path=cfg.HEALTH_FILE, backoff=cfg.HEALTH_BACKOFF,
+                 max_backoff=cfg.HEALTH_MAX_BACKOFF):
+        """
+        :param path: str or Path Optional, the state file, or None to keep
+            the state in memory only.
+        :param backoff: int Optional, the seconds an engine is skipped after
+            its first ban.
+        :param max_backoff: int Optional, the maximum seconds an engine is
+            skipped.
+        """
+        self.path = path
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._bans = None
+        self._probing = set()
+        self._lock = Lock()
+
+    def _load(self):
+        """Returns the bans of all engines, read from the file once."""
+        if self._bans is None:
+            self._bans = {}
+            if self.path and Path(self.path).is_file():
+                try:
+                    with open(self.path, encoding='utf-8') as _f:
+                        self._bans = json.load(_f)
+                except (OSError, ValueError):
+                    pass
+        return self._bans
+
+    def _save(self):
+        """Writes the bans to the file."""
+        if not self.path:
+            return
+        path = Path(self.path)
+        temp = path.with_suffix('.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp, 'w', encoding='utf-8') as _f:
+                json.dump(self._bans, _f, indent=2)
+            os.replace(temp, path)
+        except OSError:
+            pass
+
+    def state(self, engine):
+        """Returns the breaker state of an engine: CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            ban = self._load().get(engine)
+        if ban is None:
+            return CLOSED
+        return OPEN if time() < ban['retry_at'] else HALF_OPEN
+
+    def retry_in(self, engine):
+        """Returns the seconds until an engine may be probed again."""
+        with self._lock:
+            ban = self._load().get(engine)
+        return max(0.0, ban['retry_at'] - time()) if ban else 0.0
+
+    def admit(self, engine):
+        """
+        Checks if an engine may be searched.
+
+        :param engine: str The engine class name.
+        :returns CLOSED for a normal search, HALF_OPEN for a probe of one
+            page, or None if the search must be skipped.
+        """
+        with self._lock:
+            ban = self._load().get(engine)
+            if ban is None:
+                return CLOSED
+            if time() < ban['retry_at'] or engine in self._probing:
+                return None
+            self._probing.add(engine)
+            return HALF_OPEN
+
+    def record(self, engine, banned, probe=False):
+        """
+        Records the outcome of a page request.
+
+        :param engine: str The engine class name.
+        :param banned: bool If the request was banned.
+        :param probe: bool Optional, if the request was the probe of the
+            search admitted as HALF_OPEN; only it ends the probe.
+        """
+        with self._lock:
+            bans = self._load()
+            ban = bans.get(engine)
+            if probe:
+                self._probing.discard(engine)
+            if not banned:
+                if ban is not None:
+                    del bans[engine]
+                    self._save()
+                return
+            # Searches that started before the ban don't extend it.
+            if ban is not None and not probe and time() < ban['retry_at']:
+                return
+            backoff = self.backoff if ban is None else min(2 * ban['backoff'], self.max_backoff)
+            bans[engine] = {
+                'bans': (ban or {}).get('bans', 0) + 1,
+                'backoff': backoff,
+                'retry_at': time() + backoff,
+            }
+            self._save()
+
+    def release(self, engine):
+        """Ends a probe that made no request, so another search may probe.
+        Only the search admitted as HALF_OPEN may release its probe."""
+        with self._lock:
+            self._probing.discard(engine)
+
+    def reset(self, engine=None):
+        """Closes the breaker of an engine, or of all engines."""
+        with self._lock:
+            bans = self._load()
+            if engine is None:
+                bans.clear()
+            else:
+                bans.pop(engine, None)
+            self._save()
+
+
+engine_health = EngineHealth()
+"""The engine health shared by all engines of the process."""
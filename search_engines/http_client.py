@@ -1,18 +1,50 @@
 from binascii import hexlify
-from collections import namedtuple
+from collections import Counter, namedtuple
+from functools import lru_cache
+from random import uniform as random_uniform
 from secrets import token_bytes
-from time import time
+from time import sleep, time
 
 import requests
 
 from search_engines import utils as utl
+from search_engines.connections import pools
 from search_engines.config import TIMEOUT, PROXY, USER_AGENT
+from search_engines.config import URL_CACHE_SIZE
+from search_engines.config import RETRIES, RETRY_BACKOFF, RETRY_MAX_BACKOFF, RETRY_STATUS
+
+# Request error classes.
+CONNECT = 'connect'
+READ = 'read'
+STATUS = 'status'
+FATAL = 'fatal'
+
+
+def classify_error(error):
+    """Returns the class of a requests exception: CONNECT, READ or FATAL."""
+    exceptions = requests.exceptions
+    if isinstance(error, exceptions.SSLError):
+        return FATAL
+    if isinstance(error, (exceptions.ConnectionError, exceptions.ConnectTimeout)):
+        return CONNECT
+    if isinstance(error, (exceptions.ReadTimeout, exceptions.ChunkedEncodingError,
+                          exceptions.ContentDecodingError)):
+        return READ
+    return FATAL
+
+
+def backoff_delay(attempt, base=RETRY_BACKOFF, cap=RETRY_MAX_BACKOFF):
+    """Returns the seconds to wait before a retry: an exponential backoff
+    of which the second half is random, so clients don't retry in step."""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random_uniform(0, delay / 2)
 
 
 class HttpClient:
     """Performs HTTP requests. A `requests` wrapper, essentially."""
     def __init__(self, timeout=TIMEOUT, proxy=PROXY):
         self.session = requests.sessions.Session()
+        pools.mount(self.session)
 
         # Generate X-Amzn-Trace-Id for header. Code derived from:
         # https://docs.aws.amazon.com/xray/latest/devguide/xray-api-sendingdata.html#xray-api-traceids
@@ -33,29 +65,71 @@ class HttpClient:
         self.session.headers['X-Amzn-Trace-Id'] = trace_id
 
         self.timeout = timeout
+        self.proxy = proxy
         self.response = namedtuple('response', ['http', 'html'])
+        self.retries = RETRIES
+        """The maximum number of retries of a failed request."""
+        self.retry_status = RETRY_STATUS
+        """The HTTP status codes that are retried."""
+        self.metrics = Counter()
+        """Counts of 'requests', 'retries', 'failures' (requests that
+        failed after all retries) and errors by class."""
+        self.stopped = None
+        """An optional Event that, once set, cancels the pending retries."""
+        self.rate_limit = None
+        """An optional rate limiter whose turn each retry waits for."""
 
     def get(self, page):
         """Submits a HTTP GET request."""
-        page = self._quote(page)
-        try:
-            req = self.session.get(page, timeout=self.timeout)
-            self.session.headers['Referer'] = page
-        except requests.exceptions.RequestException as _e:
-            return self.response(http=0, html=_e.__doc__)
-        return self.response(http=req.status_code, html=req.text)
+        return self._request('GET', page)
 
     def post(self, page, data):
         """Submits a HTTP POST request."""
+        return self._request('POST', page, data)
+
+    def _request(self, method, page, data=None):
+        """Submits a HTTP request, retrying connection errors, read errors
+        and retryable status codes with a growing delay."""
         page = self._quote(page)
-        try:
-            req = self.session.post(page, data, timeout=self.timeout)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.metrics['retries'] += 1
+                if not self._wait_retry(attempt):
+                    break
+            self.metrics['requests'] += 1
+            try:
+                req = self.session.request(method, page, data=data, timeout=self.timeout)
+            except requests.exceptions.RequestException as _e:
+                error = classify_error(_e)
+                self.metrics[error] += 1
+                result = self.response(http=0, html=_e.__doc__)
+                if error == FATAL:
+                    break
+                continue
+
             self.session.headers['Referer'] = page
-        except requests.exceptions.RequestException as _e:
-            return self.response(http=0, html=_e.__doc__)
-        return self.response(http=req.status_code, html=req.text)
+            result = self.response(http=req.status_code, html=req.text)
+            if req.status_code not in self.retry_status:
+                return result
+            self.metrics[STATUS] += 1
+        self.metrics['failures'] += 1
+        return result
+
+    def _wait_retry(self, attempt):
+        """Waits out the backoff of a retry, and its rate limit turn.
+
+        :returns bool False if the client was stopped while waiting.
+        """
+        delay = backoff_delay(attempt)
+        if self.rate_limit is not None:
+            delay = max(delay, self.rate_limit.reserve())
+        if self.stopped is None:
+            sleep(delay)
+            return True
+        return not self.stopped.wait(delay)
 
     @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
     def _quote(url):
         """URL-encodes URLs."""
         if utl.decode_bytes(utl.unquote_url(url)) == utl.decode_bytes(url):
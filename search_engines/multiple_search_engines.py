@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Event
+
+from search_engines.dedup import merge_results
 from search_engines.results import SearchResults
 from search_engines.engines import search_engines_dict
 from search_engines import output as out
@@ -7,15 +12,20 @@ from search_engines import config as cfg
 class MultipleSearchEngines:
     """Uses multiple search engines."""
     def __init__(self, engines, agent, proxy=cfg.PROXY, timeout=cfg.TIMEOUT):
+        # Only the engines used are imported.
         self._engines = [
-            se(agent, proxy, timeout)
-            for se in search_engines_dict.values()
-            if se.__name__.lower() in engines
+            search_engines_dict[name](agent, proxy, timeout)
+            for name in search_engines_dict
+            if name in engines
         ]
         self._filter = None
 
         self.ignore_duplicate_urls = False
         self.ignore_duplicate_domains = False
+        self.concurrent = False
+        """Runs the engines in parallel threads."""
+        self.cache = None
+        """An optional PageCache of results pages, shared by the engines."""
         self.results = SearchResults()
         self.banned_engines = []
 
@@ -23,31 +33,57 @@ class MultipleSearchEngines:
         """Filters search results based on the operator."""
         self._filter = operator
 
+    def set_parser(self, parser):
+        """Sets the HTML parser backend of all engines."""
+        for engine in self._engines:
+            engine.set_parser(parser)
+
+    def print_parse_times(self):
+        """Prints the time each engine spent parsing HTML pages."""
+        out.print_parse_times(self._engines)
+
     def search(self, query, pages=cfg.SEARCH_ENGINE_RESULTS_PAGES):
         """Searches multiples engines and collects the results."""
         for engine in self._engines:
             engine.ignore_duplicate_urls = self.ignore_duplicate_urls
             engine.ignore_duplicate_domains = self.ignore_duplicate_domains
+            engine.cache = self.cache
             if self._filter:
                 engine.set_search_operator(self._filter)
 
-            engine_results = engine.search(query, pages)
-            if engine.ignore_duplicate_urls:
-                engine_results.se_results = [
-                    item for item in engine_results.se_results
-                    if item['link'] not in self.results.links()
-                ]
+        if self.concurrent:
+            all_results = search_concurrently(
+                [(engine, query, pages) for engine in self._engines]
+            )
+        else:
+            all_results = [engine.search(query, pages) for engine in self._engines]
+
+        # Results are merged in engine order, whichever engine finished first.
+        if self.ignore_duplicate_urls:
+            self._merge_duplicate_urls(all_results)
+
+        for engine, engine_results in zip(self._engines, all_results):
             if self.ignore_duplicate_domains:
                 engine_results.se_results = [
                     item for item in engine_results.se_results
-                    if item['host'] not in self.results.hosts()
+                    if not self.results.has_host(item['host'])
                 ]
-            self.results.se_results += engine_results.se_results
+            self.results.extend(engine_results.se_results)
 
             if engine.is_banned:
                 self.banned_engines.append(engine.__class__.__name__)
         return self.results
 
+    def _merge_duplicate_urls(self, all_results):
+        """Keeps each canonical URL only in the results of the first
+        engine that found it, noting all the engines that found it."""
+        names = [engine.__class__.__name__ for engine in self._engines]
+        merged = merge_results(zip(names, all_results), keep='first')
+        for name, engine_results in zip(names, all_results):
+            engine_results.se_results = [
+                item for item in merged if item['engines'][0] == name
+            ]
+
     def output(self, output=out.PRINT, path=None):
         """Prints search results and/or creates report files."""
         output = (output or '').lower()
@@ -55,15 +91,7 @@ class MultipleSearchEngines:
         if not path:
             path = str(cfg.OUTPUT_DIR) + '_'.join(query.split())
         out.console('')
-
-        if out.PRINT in output:
-            out.print_results(self._engines)
-        if out.HTML in output:
-            out.write_file(out.create_html_data(self._engines), path + '.html')
-        if out.CSV in output:
-            out.write_file(out.create_csv_data(self._engines), path + '.csv')
-        if out.JSON in output:
-            out.write_file(out.create_json_data(self._engines), path + '.json')
+        out.write_results(self._engines, output, path)
 
 
 class AllSearchEngines(MultipleSearchEngines):
@@ -72,3 +100,83 @@ class AllSearchEngines(MultipleSearchEngines):
         super().__init__(
             list(search_engines_dict), agent, proxy, timeout
         )
+
+
+def search_concurrently(searches, max_workers=None):
+    """Runs each engine search in its own worker thread.
+    Every engine paginates and sleeps independently, so the total time
+    is that of the slowest engine rather than the sum of all engines.
+
+    :param searches: list of (engine, query, pages) tuples.
+    :param max_workers: int Optional, the maximum number of threads;
+        defaults to one thread per search.
+    :returns list of SearchResults, in the order of *searches*.
+    """
+    if not searches:
+        return []
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(searches))
+    futures = [
+        executor.submit(engine.search, query, pages)
+        for engine, query, pages in searches
+    ]
+    try:
+        return [future.result() for future in futures]
+    except KeyboardInterrupt:
+        # Only the main thread sees the interrupt, so stop the workers.
+        for engine, _, _ in searches:
+            engine.stop()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+
+def iter_concurrently(searches):
+    """Runs each engine search in its own worker thread, like
+    search_concurrently(), and yields the results items of all engines
+    as soon as their pages are parsed. When the iteration stops, the
+    engines stop after their current page. An error of an engine stops
+    all engines and is raised to the caller.
+
+    :param searches: list of (engine, query, pages) tuples.
+    :returns generator of (index in *searches*, results item) tuples.
+    """
+    if not searches:
+        return
+    found = Queue()
+    stopped = Event()
+    done = object()
+
+    def run(index, engine, query, pages):
+        error = None
+        try:
+            if stopped.is_set():
+                return
+            for item in engine.iter_search(query, pages):
+                if stopped.is_set():
+                    break
+                found.put((index, item, None))
+        except Exception as err:
+            error = err
+        finally:
+            # The error is passed on to the consumer, where it's raised.
+            found.put((index, done, error))
+
+    executor = ThreadPoolExecutor(max_workers=len(searches))
+    for index, search in enumerate(searches):
+        executor.submit(run, index, *search)
+    try:
+        running = len(searches)
+        while running:
+            index, item, error = found.get()
+            if error is not None:
+                raise error
+            if item is done:
+                running -= 1
+            else:
+                yield index, item
+    finally:
+        # Also reached when the consumer stops iterating.
+        stopped.set()
+        for engine, _, _ in searches:
+            engine.stop()
+        executor.shutdown(wait=True)
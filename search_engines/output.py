@@ -1,10 +1,19 @@
 
 import csv
+import io
 import json
 import re
 from collections import namedtuple
+from functools import lru_cache, partial
+from html import escape
+from threading import Lock
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+from .config import OUTPUT_BATCH_SIZE
 from .utils import decode_bytes #, encode_str
 from .libs import windows_cmd_encoding
 
@@ -19,6 +28,74 @@ def print_results(search_engines):
         console('')
 
 
+def print_parse_times(search_engines):
+    """Prints the time each engine spent parsing HTML pages."""
+    for engine in search_engines:
+        per_page = 1000 * engine.parse_time / max(engine.parse_count, 1)
+        console(
+            f'{engine.__class__.__name__:<12}{engine.parser:<12}'
+            f'pages: {engine.parse_count:<4}'
+            f'parse time: {engine.parse_time:.3f}s ({per_page:.1f} ms/page)'
+        )
+    console('')
+
+
+def print_pool_stats(stats):
+    """Prints the requests and connections of the shared connection pools."""
+    console(
+        f'{"Pools:".ljust(10)}{stats.protocol}  requests: {stats.requests}  '
+        f'connections: {stats.connections}  reused: {stats.reuse_rate:.0%}'
+    )
+
+
+def print_cache_info(info):
+    """Prints a summary of the results pages cache."""
+    console(f'{"Cache:".ljust(10)}{info.path}')
+    console(f'{"Pages:".ljust(10)}{info.pages} ({info.expired} expired)')
+    console(f'{"Size:".ljust(10)}{info.size / 1024:.1f} KiB')
+    for engine, count in sorted(info.engines.items()):
+        console(f'{"".ljust(10)}{engine}: {count} pages')
+    if info.hits or info.misses:
+        console(f'{"Hits:".ljust(10)}{info.hits}  misses: {info.misses}')
+
+
+def print_batch_summary(summary):
+    """Prints the totals and throughput of a batch of searches."""
+    minutes = max(summary.seconds, 1e-9) / 60
+    console(f'{"Queries:".ljust(10)}{summary.queries} ({summary.queries / minutes:.1f}/min)')
+    console(f'{"Searches:".ljust(10)}{summary.searches}')
+    console(f'{"Pages:".ljust(10)}{summary.pages} ({summary.pages / minutes:.1f}/min)')
+    console(f'{"Results:".ljust(10)}{summary.results}')
+    console(f'{"Time:".ljust(10)}{summary.seconds:.1f}s')
+
+
+def write_results(search_engines, output, path):
+    """Prints the search results and/or writes them to report files.
+
+    :param search_engines: list of the engines that searched the query.
+    :param output: str The output formats, e.g. 'print', 'html,json'.
+    :param path: str The report file path, without extension.
+    """
+    formats = output_formats(output)
+    if PRINT in formats:
+        print_results(search_engines)
+    if HTML in formats:
+        write_html_file(search_engines, path + '.html')
+    if CSV in formats:
+        write_file(create_csv_data(search_engines), path + '.csv')
+    if JSON in formats:
+        write_file(create_json_data(search_engines), path + '.json')
+    if JSONL in formats:
+        with JsonLinesWriter(path + '.jsonl') as writer:
+            for engine in search_engines:
+                writer.write_all(engine.se_query, engine.__class__.__name__, engine.results)
+
+
+def output_formats(output):
+    """Returns the set of output formats in a string like 'html,json'."""
+    return set(re.split(r'[\s,]+', (output or '').lower())) - {''}
+
+
 def create_csv_data(search_engines):
     """CSV formats the search results."""
     encoder = decode_bytes
@@ -28,9 +105,7 @@ def create_csv_data(search_engines):
         for i in engine.results:
             row = [
                 engine.se_query, engine.__class__.__name__,
-                # Note: 'host' key throws exception with duckduckgo.
-                # i['host'], i['link'], i['title'], i['text']
-                i['link'], i['title'], i['text']
+                i.get('host', ''), i['link'], i['title'], i['text']
             ]
             row = [encoder(i) for i in row]
             data.append(row)
@@ -42,7 +117,7 @@ def create_json_data(search_engines):
     jobj = {
         'query': search_engines[0].se_query,
         'results': {
-            se.__class__.__name__: list(se.results) #[i for i in se.results]
+            se.__class__.__name__: [dict(i) for i in se.results]
             for se in search_engines
         }
     }
@@ -51,30 +126,54 @@ def create_json_data(search_engines):
 
 def create_html_data(search_engines):
     """HTML formats the search results."""
+    return ''.join(_html_parts(search_engines))
+
+
+def write_html_file(search_engines, path, encoding='utf-8'):
+    """Writes the HTML report of the search results to file, part by
+    part, so the whole report is never held in memory."""
+    try:
+        with open(path, 'w', encoding=encoding, newline='') as _f:
+            _f.writelines(_html_parts(search_engines))
+            console('Output file: ' + path)
+    except IOError as err:
+        console(err, level=Level.error)
+
+
+def _html_parts(search_engines):
+    """Yields the parts of the HTML report, in order."""
     query = decode_bytes(search_engines[0].se_query) if search_engines else ''
-    tables = ''
+    bold = _highlighter(query)
+    # The templates are split where the nested tables and rows go.
+    head, tail = HtmlTemplate.html.format(query=escape(query), table='\0').split('\0')
+    yield head
 
     for engine in search_engines:
-        rows = ''
+        engine_name = escape(engine.__class__.__name__)
+        table_head, table_tail = HtmlTemplate.table.format(engine=engine_name, rows='\0').split('\0')
+        yield table_head
+
         for i, _v in enumerate(engine.results, 1):
             data = ''
             if 'title' in engine.se_filters:
-                data += HtmlTemplate.data.format(_replace_with_bold(query, _v['title']))
+                data += HtmlTemplate.data.format(bold(escape(_v['title'], False)))
             if 'text' in engine.se_filters:
-                data += HtmlTemplate.data.format(_replace_with_bold(query, _v['text']))
-            link = _replace_with_bold(query, _v['link']) if 'url' in engine.se_filters else _v['link']
-            rows += HtmlTemplate.row.format(number=i, href=_v['link'], link=link, data=data)
-
-        engine_name = engine.__class__.__name__
-        tables += HtmlTemplate.table.format(engine=engine_name, rows=rows)
-    return HtmlTemplate.html.format(query=query, table=tables)
+                data += HtmlTemplate.data.format(bold(escape(_v['text'], False)))
+            href = escape(_v['link'])
+            link = bold(href) if 'url' in engine.se_filters else href
+            yield HtmlTemplate.row.format(number=i, href=href, link=link, data=data)
+        yield table_tail
+    yield tail
 
 
-def _replace_with_bold(query, data):
-    """Places the query in <b> tags."""
-    for match in re.findall(query, data, re.I):
-        data = data.replace(match, f'<b>{match}</b>')
-    return data
+@lru_cache(maxsize=32)
+def _highlighter(query):
+    """Returns a function that places the query in <b> tags, in HTML
+    escaped text; the query is matched literally, ignoring case."""
+    if not query:
+        return lambda data: data
+    pattern = re.compile(re.escape(escape(query, False)), re.I)
+    return partial(pattern.sub, lambda match: f'<b>{match.group()}</b>')
 
 
 def write_file(data, path, encoding='utf-8'):
@@ -91,6 +190,147 @@ def write_file(data, path, encoding='utf-8'):
         console(err, level=Level.error)
 
 
+def _default_json_encoder():
+    """Returns orjson's encoder if it is installed, else the json module's."""
+    if orjson is not None:
+        return lambda obj: orjson.dumps(obj).decode('utf-8')
+    return json.JSONEncoder(ensure_ascii=False).encode
+
+
+encode_json = _default_json_encoder()
+"""The JSON encoder of the streaming writers: a function that returns
+the JSON string of an object."""
+
+
+class ResultsWriter:
+    """
+    Appends search results to a file as they are collected, so that
+    results don't pile up in memory and are kept if the program stops.
+    Records are buffered and written every *batch_size* records, and when
+    the writer is flushed or closed. Writers can be shared by threads, and
+    used as context managers.
+    """
+    extension = ''
+
+    def __init__(self, path, batch_size=OUTPUT_BATCH_SIZE, encoder=None):
+        """
+        :param path: str The file path.
+        :param batch_size: int Optional, the records buffered between writes.
+        :param encoder: Optional, a function that returns the JSON string of
+            an object; defaults to encode_json.
+        """
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.encode = encoder or encode_json
+        self.count = 0
+        """The number of records written."""
+        self._buffer = io.StringIO()
+        self._pending = 0
+        self._lock = Lock()
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._start()
+
+    def _start(self):
+        """Buffers the start of the file."""
+
+    def _end(self):
+        """Buffers the end of the file."""
+
+    def _record(self, query, engine, item):
+        """Buffers one record."""
+        raise NotImplementedError()
+
+    def write(self, query, engine, item):
+        """Writes a results item.
+
+        :param query: str The search query.
+        :param engine: str The engine name.
+        :param item: dict The results item.
+        """
+        with self._lock:
+            self._record(query, engine, item)
+            self.count += 1
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self._flush()
+
+    def write_all(self, query, engine, items):
+        """Writes the results items of an engine."""
+        for item in items:
+            self.write(query, engine, item)
+
+    def _flush(self):
+        """Writes the buffered records to the file."""
+        self._file.write(self._buffer.getvalue())
+        self._file.flush()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pending = 0
+
+    def flush(self):
+        """Writes the buffered records to the file."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Writes the buffered records and the end of the file, and closes it."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._end()
+            self._flush()
+            self._file.close()
+        console('Output file: ' + self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JsonLinesWriter(ResultsWriter):
+    """Writes one JSON object per line: the query, engine and item data."""
+    extension = '.jsonl'
+
+    def _record(self, query, engine, item):
+        self._buffer.write(self.encode(dict(item, query=query, engine=engine)))
+        self._buffer.write('\n')
+
+
+class JsonArrayWriter(ResultsWriter):
+    """Writes a JSON array of objects with the query, engine and item data.
+    The array is complete once the writer is closed."""
+    extension = '.json'
+
+    def _start(self):
+        self._buffer.write('[')
+
+    def _record(self, query, engine, item):
+        self._buffer.write(',\n' if self.count else '\n')
+        self._buffer.write(self.encode(dict(item, query=query, engine=engine)))
+
+    def _end(self):
+        self._buffer.write('\n]\n')
+
+
+class CsvWriter(ResultsWriter):
+    """Writes CSV rows of query, engine, domain, URL, title and text."""
+    extension = '.csv'
+
+    def _start(self):
+        self._csv = csv.writer(self._buffer)
+        self._csv.writerow(['query', 'engine', 'domain', 'URL', 'title', 'text'])
+
+    def _record(self, query, engine, item):
+        row = [query, engine, item.get('host', ''), item['link'], item['title'], item['text']]
+        self._csv.writerow([decode_bytes(i) for i in row])
+
+
+WRITERS = {writer.extension[1:]: writer for writer in (JsonLinesWriter, JsonArrayWriter, CsvWriter)}
+"""The streaming writer of each output format."""
+
+
 def console(msg, end='\n', level=None):
     """Prints data on the console."""
     clear_line = '\r\x1b[2K\r'
@@ -107,6 +347,7 @@ Level = namedtuple('Level', ['info', 'warning', 'error'])(
 PRINT = 'print'
 HTML = 'html'
 JSON = 'json'
+JSONL = 'jsonl'
 CSV = 'csv'
 
 
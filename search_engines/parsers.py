@@ -0,0 +1,188 @@
+"""
+HTML parser backends for search results pages.
+
+'html.parser' (BeautifulSoup with the standard library parser) is the
+default. 'lxml' (BeautifulSoup with the lxml builder) and 'selectolax'
+are much faster when those packages are installed. Every backend returns
+a document with the BeautifulSoup methods the engines use: select(),
+select_one(), get_text(), .text, .get() and [attribute].
+"""
+import re
+from functools import lru_cache
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+HTML_PARSER = 'html.parser'
+LXML = 'lxml'
+SELECTOLAX = 'selectolax'
+BACKENDS = (HTML_PARSER, LXML, SELECTOLAX)
+
+
+def is_available(backend):
+    """Checks if a parser backend is supported and installed."""
+    if backend == SELECTOLAX:
+        return SelectolaxParser is not None
+    if backend in (HTML_PARSER, LXML):
+        return builder_registry.lookup(backend) is not None
+    return False
+
+
+@lru_cache(maxsize=None)
+def region_strainer(region):
+    """
+    Returns a SoupStrainer that keeps only the elements that have one of
+    the *region* classes, and everything inside them.
+
+    :param region: tuple The class names.
+    """
+    # Class values are matched whole or one by one, depending on the
+    #   BeautifulSoup version, so match a class name between spaces.
+    names = '|'.join(re.escape(name) for name in region)
+    return SoupStrainer(class_=re.compile(rf'(?:^|\s)(?:{names})(?:\s|$)'))
+
+
+def parse(html, backend=HTML_PARSER, region=None):
+    """
+    Parses an HTML page.
+
+    :param html: str The page source.
+    :param backend: str Optional, one of BACKENDS.
+    :param region: Optional, a tuple of class names. BeautifulSoup backends
+        then build only the elements with those classes (and their
+        contents) and skip the rest of the page. selectolax always builds
+        the whole page, which is fast anyway.
+    :returns The document root.
+    """
+    if backend == SELECTOLAX:
+        return SelectolaxNode(SelectolaxParser(html))
+    if backend in (HTML_PARSER, LXML):
+        if region:
+            return BeautifulSoup(html, backend, parse_only=region_strainer(tuple(region)))
+        return BeautifulSoup(html, backend)
+    raise ValueError(f'Unsupported parser "{backend}"')
+
+
+class SelectolaxNode:
+    """Gives a selectolax node the BeautifulSoup Tag methods used by engines."""
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, selector):
+        """Returns all the nodes that match a CSS selector."""
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector):
+        """Returns the first node that matches a CSS selector, or None."""
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, separator='', strip=False):
+        """Returns the text of the node and its descendants."""
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    @property
+    def text(self):
+        """The text of the node and its descendants."""
+        return self._node.text(deep=True)
+
+    def get(self, attribute, default=None):
+        """Returns an attribute value."""
+        attributes = getattr(self._node, 'attributes', {})
+        value = attributes.get(attribute, default)
+        return default if value is None else value
+
+    def __getitem__(self, attribute):
+        value = self.get(attribute)
+        if value is None:
+            raise KeyError(attribute)
+        return value
+
+    def __bool__(self):
+        return True
+
+
+class Document:
+    """
+    A response page that is parsed lazily, at most once. It has the HTTP
+    status and source of the response (.http, .html), so it can be given
+    to _is_ok(), and the select(), select_one() and get_text() methods of
+    the parsed page, so it can be given to _filter_results() and
+    _next_page(). The page is only parsed when one of those is called.
+    """
+    __slots__ = ('http', 'html', '_parse', '_root')
+
+    def __init__(self, http, html, parse):
+        """
+        :param int http: The HTTP status code.
+        :param str html: The page source.
+        :param parse: The function that parses *html*.
+        """
+        self.http = http
+        self.html = html
+        self._parse = parse
+        self._root = None
+
+    @property
+    def root(self):
+        """The parsed page."""
+        if self._root is None:
+            self._root = self._parse(self.html)
+        return self._root
+
+    @property
+    def is_parsed(self):
+        """Indicates if the page has been parsed."""
+        return self._root is not None
+
+    def select(self, selector):
+        """Returns all the tags that match a CSS selector."""
+        return self.root.select(selector)
+
+    def select_one(self, selector):
+        """Returns the first tag that matches a CSS selector, or None."""
+        return self.root.select_one(selector)
+
+    def get_text(self, *args, **kwargs):
+        """Returns the text of the page."""
+        return self.root.get_text(*args, **kwargs)
+
+
+class CompiledSelector:
+    """
+    A CSS selector compiled once for a parser backend. BeautifulSoup
+    backends get a compiled soupsieve matcher; selectolax compiles its
+    selectors natively, so the pattern is passed through.
+    """
+    __slots__ = ('pattern', '_matcher')
+
+    def __init__(self, pattern, backend=HTML_PARSER):
+        self.pattern = pattern
+        self._matcher = None if backend == SELECTOLAX else soupsieve.compile(pattern)
+
+    def select(self, node):
+        """Returns all the tags of *node* that match the selector."""
+        if isinstance(node, Document):
+            node = node.root
+        if self._matcher is None:
+            return node.select(self.pattern)
+        return self._matcher.select(node)
+
+    def select_one(self, node):
+        """Returns the first tag of *node* that matches the selector, or None."""
+        if isinstance(node, Document):
+            node = node.root
+        if self._matcher is None:
+            return node.select_one(self.pattern)
+        return self._matcher.select_one(node)
@@ -0,0 +1,136 @@
+"""
+Per-engine request rate limits.
+"""
+from pathlib import Path
+from random import uniform as random_uniform
+from threading import Lock
+from time import monotonic, time
+
+from search_engines import config as cfg
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class TokenBucket:
+    """
+    Spaces the requests to an engine at least *interval* seconds apart,
+    plus a random jitter of up to *jitter* seconds, while letting up to
+    *burst* requests go out at once after a quiet period. Requests reserve
+    their turn without waiting, so one bucket can be shared by threads and
+    by asyncio tasks alike. Thread-safe.
+    """
+    def __init__(self, interval=1.0, jitter=0.0, burst=1):
+        """
+        :param interval: float Optional, the minimum seconds between requests.
+        :param jitter: float Optional, the maximum random seconds added to
+            each interval.
+        :param burst: int Optional, the number of requests allowed at once.
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.burst = max(1, burst)
+        self._ready = 0.0
+        self._lock = Lock()
+
+    def _next_turn(self, ready, now):
+        """Returns the start of the next request turn and the turn after it."""
+        # Unused turns of the last quiet period are kept, up to a burst.
+        start = max(ready, now - (self.burst - 1) * self.interval)
+        return start, start + self.interval + random_uniform(0, self.jitter)
+
+    def reserve(self):
+        """Reserves the next request turn.
+
+        :returns float The seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = monotonic()
+            start, self._ready = self._next_turn(self._ready, now)
+        return max(0.0, start - now)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A TokenBucket whose turns are kept in a local file, so that all the
+    processes that use the same file share the rate limit. The file is
+    locked while a turn is reserved; where file locks are not supported,
+    the limit only holds within this process.
+    """
+    def __init__(self, path, interval=1.0, jitter=0.0, burst=1):
+        """
+        :param path: str or Path The file shared by the processes.
+        """
+        super().__init__(interval, jitter, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def reserve(self):
+        with self._lock, open(self.path, 'a+', encoding='utf-8') as _f:
+            _lock_file(_f)
+            try:
+                _f.seek(0)
+                try:
+                    ready = float(_f.read() or 0)
+                except ValueError:
+                    ready = 0.0
+                # Processes don't share a monotonic clock, so use wall time.
+                now = time()
+                start, ready = self._next_turn(ready, now)
+                _f.seek(0)
+                _f.truncate()
+                _f.write(repr(ready))
+                _f.flush()
+            finally:
+                _unlock_file(_f)
+        return max(0.0, start - now)
+
+
+def _lock_file(file):
+    """Locks an open file for this process."""
+    if fcntl:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    elif msvcrt:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(file):
+    """Unlocks a file locked by _lock_file()."""
+    if fcntl:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    elif msvcrt:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+_limiters = {}
+_limiters_lock = Lock()
+
+
+def rate_limiter(engine):
+    """
+    Returns the rate limiter of an engine, shared by all its instances
+    in the process. Its settings are the cfg.RATE_LIMITS of the engine,
+    or the default ones; when cfg.RATE_LIMIT_DIR is set, the limit is
+    also shared with other processes.
+
+    :param engine: str The engine class name, e.g. 'Mojeek'.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(engine)
+        if limiter is None:
+            settings = dict(cfg.RATE_LIMITS['default'], **cfg.RATE_LIMITS.get(engine, {}))
+            if cfg.RATE_LIMIT_DIR:
+                path = Path(cfg.RATE_LIMIT_DIR) / f'{engine.lower()}.turn'
+                limiter = FileTokenBucket(path, **settings)
+            else:
+                limiter = TokenBucket(**settings)
+            _limiters[engine] = limiter
+        return limiter
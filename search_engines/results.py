@@ -1,41 +1,172 @@
+import sys
+from collections.abc import Mapping, Sequence
+
+FIELDS = ('host', 'link', 'title', 'text')
+"""The fields of a search results item."""
+
+
+class ResultItem(Mapping):
+    """
+    A search results item: host, link, title and text. It takes much less
+    memory than a dict, and hosts are interned, so items of the same host
+    share one string. It reads like a dict of its fields (item['link'],
+    item.get('host'), dict(item)) and compares equal to such a dict.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, host='', link='', title='', text=''):
+        self.host = sys.intern(host) if host else host
+        self.link = link
+        self.title = title
+        self.text = text
+
+    @classmethod
+    def from_mapping(cls, item):
+        """Returns a ResultItem of the fields of a results item."""
+        if isinstance(item, cls):
+            return item
+        return cls(*(item.get(field, '') for field in FIELDS))
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return f'ResultItem(host={self.host!r}, link={self.link!r})'
+
+
+class ResultColumns(Sequence):
+    """
+    Stores results items column-wise, one list per field, without an
+    object per item. Items are returned as new ResultItems; fields other
+    than FIELDS are not kept.
+    """
+    __slots__ = ('_columns',)
+
+    def __init__(self, items=()):
+        self._columns = {field: [] for field in FIELDS}
+        for item in items:
+            self.append(item)
+
+    def append(self, item):
+        """Appends an item."""
+        for field, column in self._columns.items():
+            value = item.get(field, '')
+            column.append(sys.intern(value) if field == 'host' and value else value)
+
+    def column(self, field):
+        """Returns a copy of the values of a field."""
+        return list(self._columns[field])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ResultItem(*(self._columns[field][index] for field in FIELDS))
+
+    def __len__(self):
+        return len(self._columns['link'])
+
+
 class SearchResults:
     """Stores the search results"""
-    def __init__(self, items=None):
+    def __init__(self, items=None, columnar=False):
+        """
+        :param items: list Optional, the results items.
+        :param columnar: bool Optional, stores the items column-wise,
+            which takes the least memory for very many results.
+        """
+        self._links = set()
+        self._hosts = set()
+        self._fingerprints = set()
+        self.columnar = columnar
         self.se_results = items or []
 
+    @property
+    def se_results(self):
+        """The list of results items. Add items with append() or extend(),
+        or assign a new list, so that the indexes stay current."""
+        return self._items
+
+    @se_results.setter
+    def se_results(self, items):
+        """Replaces the results items and rebuilds the indexes."""
+        self._items = ResultColumns(items) if self.columnar else list(items)
+        self._links.clear()
+        self._hosts.clear()
+        self._fingerprints.clear()
+        for item in self._items:
+            self._index(item)
+
+    @staticmethod
+    def _fingerprint(item):
+        """Returns a hashable key of the item's data."""
+        return tuple(item.get(key) for key in FIELDS)
+
+    def _index(self, item):
+        """Adds an item to the link, host and item indexes."""
+        self._links.add(item.get('link'))
+        self._hosts.add(item.get('host'))
+        self._fingerprints.add(self._fingerprint(item))
+
+    def has_link(self, link):
+        """Checks if a link is in the search results"""
+        return link in self._links
+
+    def has_host(self, host):
+        """Checks if a domain is in the search results"""
+        return host in self._hosts
+
+    def _column(self, field):
+        """Returns the values of a field of all items."""
+        if self.columnar:
+            return self._items.column(field)
+        return [row.get(field) for row in self._items]
+
     def links(self):
         """Returns the links found in search results"""
-        return [row.get('link') for row in self.se_results]
+        return self._column('link')
 
     def titles(self):
         """Returns the titles found in search results"""
-        return [row.get('title') for row in self.se_results]
+        return self._column('title')
 
     def text(self):
         """Returns the text found in search results"""
-        return [row.get('text') for row in self.se_results]
+        return self._column('text')
 
     def hosts(self):
         """Returns the domains found in search results"""
-        return [row.get('host') for row in self.se_results]
+        return self._column('host')
 
     def results(self):
         """Returns all data found in search results"""
-        return self.se_results
+        return list(self._items) if self.columnar else self._items
 
     def __getitem__(self, index):
-        return self.se_results[index]
+        return self._items[index]
 
     def __len__(self):
-        return len(self.se_results)
+        return len(self._items)
+
+    def __contains__(self, item):
+        return self._fingerprint(item) in self._fingerprints
 
     def __str__(self):
-        return f'<SearchResults ({len(self.se_results)} items)>'
+        return f'<SearchResults ({len(self._items)} items)>'
 
     def append(self, item):
         """Appends an item to the results list."""
-        self.se_results.append(item)
+        self._items.append(item)
+        self._index(item)
 
     def extend(self, items):
         """Appends items to the results list."""
-        self.se_results.extend(items)
+        for item in items:
+            self.append(item)
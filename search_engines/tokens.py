@@ -0,0 +1,54 @@
+"""
+Cache of landing page form fields and session tokens.
+"""
+from threading import Lock
+from time import time
+
+from search_engines import config as cfg
+
+
+class TokenCache:
+    """
+    Keeps the data that engines scrape from their landing page before
+    the first results page (hidden form fields, session tokens and the
+    cookies that go with them), so following searches can skip that
+    request. Entries are keyed on engine, user agent and scope, and
+    expire after *ttl* seconds. Thread-safe.
+    """
+    def __init__(self, ttl=cfg.TOKEN_TTL):
+        """
+        :param ttl: int Optional, the seconds an entry stays valid.
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = Lock()
+
+    def get(self, key):
+        """Returns the cached tokens of *key*, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] + self.ttl < time():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key, tokens):
+        """Stores the tokens of *key*."""
+        with self._lock:
+            self._entries[key] = (time(), tokens)
+
+    def invalidate(self, key):
+        """Forgets the tokens of *key*, e.g. after the engine rejected them."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Forgets all tokens."""
+        with self._lock:
+            self._entries.clear()
+
+
+landing_tokens = TokenCache()
+"""The token cache shared by all engines of the process."""
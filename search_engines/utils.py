@@ -1,26 +1,75 @@
-import requests
+import re
+from collections import namedtuple
+from functools import lru_cache
+from html import unescape
+from urllib.parse import quote, unquote, urlsplit
 
+from search_engines.config import URL_CACHE_SIZE
+from search_engines.dedup import canonical_url
 
+_HTML_TAG = re.compile(r'<[^>]*>')
+_NEWLINES = re.compile(r'[\r\n]')
+
+ParsedUrl = namedtuple('ParsedUrl', ['scheme', 'netloc', 'domain', 'canonical'])
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def quote_url(url):
     """encodes URLs."""
-    return requests.utils.quote(url, safe=';/?:@&=+$,#')
+    return quote(url, safe=';/?:@&=+$,#')
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def unquote_url(url):
     """decodes URLs."""
-    return decode_bytes(requests.utils.unquote(url))
+    return decode_bytes(unquote(url))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def parse_url(url):
+    """
+    Parses a URL once; repeated URLs are read from a bounded cache.
+
+    :param url: str The URL.
+    :returns ParsedUrl The scheme, netloc, domain (lowercase, without
+        port and 'www.') and the canonical dedup key of the URL.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return ParsedUrl('', '', '', url)
+    host = parts.netloc.lower().split(':')[0].replace('www.', '')
+    return ParsedUrl(parts.scheme, parts.netloc, host, canonical_url(url))
+
+
+def process_links(links):
+    """
+    Parses many links in one call, e.g. all the links of a results page.
+
+    :param links: iterable of str The links.
+    :returns list of ParsedUrl, in link order.
+    """
+    return [parse_url(link) for link in links]
 
 
 def is_url(link):
     """Checks if link is URL"""
-    parts = requests.utils.urlparse(link)
+    parts = parse_url(link)
     return bool(parts.scheme and parts.netloc)
 
 
 def domain(url):
     """Returns domain form URL"""
-    host = requests.utils.urlparse(url).netloc
-    return host.lower().split(':')[0].replace('www.', '')
+    return parse_url(url).domain
+
+
+def strip_tags(html):
+    """Returns the text of an HTML snippet, without tags or line breaks."""
+    if '<' in html:
+        html = _HTML_TAG.sub('', html)
+    if '&' in html:
+        html = unescape(html)
+    return _NEWLINES.sub('', html)
 
 
 def decode_bytes(s, encoding='utf-8', errors='replace'):
@@ -4,7 +4,9 @@ import argparse
 try:
     from search_engines.engines import search_engines_dict
     from search_engines.multiple_search_engines import MultipleSearchEngines, AllSearchEngines
-    from search_engines import config
+    from search_engines.cache import PageCache
+    from search_engines.batch import BatchSearch, read_queries
+    from search_engines import config, output
 except ImportError as err:
     MSG = '\nPlease install `search_engines` to resolve this error.'
     raise ImportError(f'{MSG}\n') from err
@@ -13,12 +15,12 @@ except ImportError as err:
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('-q',
-                        help='query', required=True)
+                        help='query')
     parser.add_argument('-e',
                         help='search engine(s) - ' + ', '.join(search_engines_dict) + ', or "all"',
                         default='duckduckgo')
     parser.add_argument('-o',
-                        help='output file [html, csv, json]',
+                        help='output file [html, csv, json, jsonl]',
                         default='print')
     parser.add_argument('-n',
                         help='filename for output file',
@@ -33,12 +35,48 @@ def main():
     parser.add_argument('-i',
                         help='ignore duplicates, useful when multiple search engines are used',
                         action='store_true')
+    parser.add_argument('-c',
+                        help='search multiple engines concurrently',
+                        action='store_true')
+    parser.add_argument('-parser',
+                        help='HTML parser [html.parser, lxml, selectolax]',
+                        default=config.HTML_PARSER)
+    parser.add_argument('-t',
+                        help='print the parse time of each engine and the connection reuse',
+                        action='store_true')
+    parser.add_argument('-cache',
+                        help='use the results pages cache',
+                        action='store_true',
+                        default=config.USE_CACHE)
+    parser.add_argument('-no-cache',
+                        help='bypass the results pages cache',
+                        dest='cache',
+                        action='store_false')
+    parser.add_argument('-refresh',
+                        help='fetch all pages again and update the cache',
+                        action='store_true')
+    parser.add_argument('-cache-info',
+                        help='print the cache contents and exit',
+                        action='store_true')
+    parser.add_argument('-b',
+                        help='batch file of queries, one per line, or "-" for stdin',
+                        default=None)
+    parser.add_argument('-w',
+                        help='maximum number of searches running at once in batch mode',
+                        default=config.BATCH_WORKERS,
+                        type=int)
     parser.add_argument('-proxy',
                         help='use proxy (protocol://ip:port)',
                         default=config.PROXY)
 
     args = parser.parse_args()
 
+    if args.cache_info:
+        output.print_cache_info(PageCache().info())
+        return
+    if not args.q and not args.b:
+        parser.error('one of the following arguments is required: -q, -b')
+
     proxy = args.proxy
     timeout = config.TIMEOUT + (10 * bool(proxy))
     agent = config.FAKE_USER_AGENT
@@ -49,20 +87,82 @@ def main():
 
     if not engines:
         print('Please choose a search engine: ' + ', '.join(search_engines_dict))
+    elif args.b:
+        batch_search(args, engines, agent, proxy, timeout)
     else:
         if 'all' in engines:
             engine = AllSearchEngines(agent, proxy, timeout)
+            engine.concurrent = args.c
         elif len(engines) > 1:
             engine = MultipleSearchEngines(engines, agent, proxy, timeout)
+            engine.concurrent = args.c
         else:
             engine = search_engines_dict[engines[0]](agent, proxy, timeout)
 
         engine.ignore_duplicate_urls = args.i
+        engine.set_parser(args.parser)
+        if args.cache or args.refresh:
+            engine.cache = PageCache()
+            engine.cache.refresh = args.refresh
         if args.f:
             engine.set_search_operator(args.f)
 
         engine.search(args.q, args.p)
         engine.output(args.o, args.n)
+        if args.t:
+            from search_engines.connections import pools
+            engine.print_parse_times()
+            output.print_pool_stats(pools.stats())
+
+
+def batch_search(args, engines, agent, proxy, timeout):
+    """Searches each query of the batch file and writes its results."""
+    if 'all' in engines:
+        engines = list(search_engines_dict)
+    cache = None
+    if args.cache or args.refresh:
+        cache = PageCache()
+        cache.refresh = args.refresh
+
+    def make_engine(name):
+        engine = search_engines_dict[name](agent, proxy, timeout)
+        engine.ignore_duplicate_urls = args.i
+        engine.set_parser(args.parser)
+        engine.cache = cache
+        engine.quiet = True
+        if args.f:
+            engine.set_search_operator(args.f)
+        return engine
+
+    # The file formats are streamed to one file for the whole batch as
+    #   results are collected; other formats are written per query.
+    formats = output.output_formats(args.o)
+    writers = [
+        writer(args.n + writer.extension)
+        for name, writer in output.WRITERS.items() if name in formats
+    ]
+    per_query = ','.join(formats - set(output.WRITERS))
+
+    def save(query, results):
+        path = args.n + '_' + '_'.join(query.split())
+        output.write_results([engine for _, engine in results], per_query, path)
+        if args.t:
+            output.print_parse_times([engine for _, engine in results])
+
+    def stream(query, engine, item):
+        for writer in writers:
+            writer.write(query, engine, item)
+
+    batch = BatchSearch(make_engine, engines, args.p, workers=args.w)
+    try:
+        summary = batch.run(read_queries(args.b), save, stream)
+    finally:
+        for writer in writers:
+            writer.close()
+    output.print_batch_summary(summary)
+    if args.t:
+        from search_engines.connections import pools
+        output.print_pool_stats(pools.stats())
 
 
 if __name__ == '__main__':
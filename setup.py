@@ -10,5 +10,11 @@ setup(
     author='Tasos M. Adamopoulos, modified by Craig S. Echt',
     license='MIT, GNU',
     packages=find_packages(),
-    install_requires=requirements
+    install_requires=requirements,
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['lxml', 'selectolax'],
+        'http2': ['httpx[http2]'],
+        'json': ['orjson'],
+    }
 )